@@ -62,6 +62,12 @@ create table public.cases (
   constraint cases_pkey primary key (case_id)
 ) TABLESPACE pg_default;
 
+create index IF not exists idx_cases_open_created_at_case_id on public.cases using btree (created_at, case_id) TABLESPACE pg_default
+where
+  (status = 'OPEN'::case_status);
+
+create index IF not exists idx_cases_client_email_status on public.cases using btree (client_email, status) TABLESPACE pg_default;
+
 create table public.client_communications (
   communication_id uuid not null default gen_random_uuid (),
   channel public.communication_channel not null,
@@ -80,6 +86,12 @@ create table public.client_communications (
   constraint client_communications_case_id_fkey foreign KEY (case_id) references cases (case_id)
 ) TABLESPACE pg_default;
 
+create index IF not exists idx_client_communications_case_created_at on public.client_communications using btree (case_id, created_at desc) TABLESPACE pg_default;
+
+create index IF not exists idx_client_communications_resend_id on public.client_communications using btree (resend_id) TABLESPACE pg_default
+where
+  (resend_id is not null);
+
 create table public.document_analysis (
   analysis_content text not null,
   analysis_status character varying(20) null default 'completed'::character varying,
@@ -109,6 +121,10 @@ create table public.document_analysis (
   )
 ) TABLESPACE pg_default;
 
+create index IF not exists idx_document_analysis_case_analyzed_at on public.document_analysis using btree (case_id, analyzed_at desc) TABLESPACE pg_default;
+
+create index IF not exists idx_document_analysis_document_analyzed_at on public.document_analysis using btree (document_id, analyzed_at desc) TABLESPACE pg_default;
+
 create table public.documents (
   original_file_name character varying(500) not null,
   original_file_size bigint not null,
@@ -140,6 +156,10 @@ create table public.documents (
   )
 ) TABLESPACE pg_default;
 
+create index IF not exists idx_documents_batch_id on public.documents using btree (batch_id) TABLESPACE pg_default
+where
+  (batch_id is not null);
+
 create table public.error_logs (
   error_id uuid not null default extensions.uuid_generate_v4 (),
   component character varying(255) not null,
@@ -15,7 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import the FastAPI application
 from src.app import app
-from src.config.settings import PORT
+from src.config.settings import PORT, WEB_CONCURRENCY
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,5 +23,13 @@ logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
     import uvicorn
-    logger.info(f"Starting Legal Communications Backend on port {PORT}")
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
\ No newline at end of file
+    logger.info(f"Starting Legal Communications Backend on port {PORT} with {WEB_CONCURRENCY} worker(s)")
+    # uvloop/httptools ship with uvicorn[standard]; each worker opens its own DB pool in the lifespan
+    uvicorn.run(
+        "main:app" if WEB_CONCURRENCY > 1 else app,
+        host="0.0.0.0",
+        port=PORT,
+        workers=WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools"
+    )
@@ -3,7 +3,7 @@ Base contract models for resource operations
 """
 
 from typing import List, Dict, Literal, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from enum import Enum
 
 class FieldType(str, Enum):
@@ -72,10 +72,15 @@ class ResourceContract(BaseModel):
     order_allowed: List[str]
     limits: ContractLimits = ContractLimits()
     joins_allowed: Optional[List[JoinDefinition]] = None  # Supported JOINs
+    
+    # Name -> field index, built once on first lookup (contracts are immutable after load)
+    _fields_by_name: Optional[Dict[str, ContractField]] = PrivateAttr(default=None)
 
     def get_field(self, field_name: str) -> Optional[ContractField]:
         """Get field definition by name"""
-        return next((f for f in self.fields if f.name == field_name), None)
+        if self._fields_by_name is None:
+            self._fields_by_name = {f.name: f for f in self.fields}
+        return self._fields_by_name.get(field_name)
     
     def is_field_readable(self, field_name: str) -> bool:
         """Check if field is readable"""
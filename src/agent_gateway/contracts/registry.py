@@ -13,6 +13,9 @@ from agent_gateway.contracts.agent_conversations import get_agent_conversations_
 from agent_gateway.contracts.agent_messages import get_agent_messages_contract
 from agent_gateway.contracts.agent_summaries import get_agent_summaries_contract
 
+# Operation enum lookup by permission string, built once at import
+_OPERATIONS_BY_VALUE: Dict[str, Operation] = {op.value: op for op in Operation}
+
 def get_all_contracts(role: str = "default") -> Dict[str, ResourceContract]:
     """Get all resource contracts for the specified role"""
     return {
@@ -89,18 +92,11 @@ def _filter_contract_operations(contract: ResourceContract, allowed_operations:
         Filtered contract with only allowed operations
     """
     # Convert string operations to Operation enum
-    operation_mapping = {
-        "READ": Operation.READ,
-        "INSERT": Operation.INSERT, 
-        "UPDATE": Operation.UPDATE,
-        "DELETE": Operation.DELETE
+    allowed_ops = {
+        _OPERATIONS_BY_VALUE[op] for op in allowed_operations 
+        if op in _OPERATIONS_BY_VALUE
     }
     
-    allowed_ops = [
-        operation_mapping[op] for op in allowed_operations 
-        if op in operation_mapping
-    ]
-    
     # Filter the contract's allowed operations
     filtered_ops = [
         op for op in contract.ops_allowed 
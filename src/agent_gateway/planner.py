@@ -5,6 +5,7 @@ Planner component - converts natural language + contracts to internal DSL
 import logging
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+import orjson
 
 from agent_gateway.contracts.base import ResourceContract
 from agent_gateway.models.dsl import DSL, DSLOperation, ReadOperation, UpdateOperation, InsertOperation
@@ -271,14 +272,12 @@ class Planner:
     def _generate_fingerprint(self, dsl: DSL) -> str:
         """Generate stable hash of DSL for caching/replay"""
         import hashlib
-        import json
         
-        # Convert DSL to dictionary and create stable JSON
-        dsl_dict = dsl.dict()
-        stable_json = json.dumps(dsl_dict, sort_keys=True, separators=(',', ':'))
+        # Convert DSL to dictionary and create stable (key-sorted, compact) JSON bytes
+        stable_json = orjson.dumps(dsl.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
         
         # Generate SHA256 hash
-        return hashlib.sha256(stable_json.encode()).hexdigest()[:16]  # First 16 chars
+        return hashlib.sha256(stable_json).hexdigest()[:16]  # First 16 chars
 
 # Global planner instance
 _planner: Optional[Planner] = None
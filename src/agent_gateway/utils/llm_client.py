@@ -2,19 +2,29 @@
 LLM client utilities for router and planner components
 """
 
-import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Literal
+import orjson
 from openai import AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
+
+from utils.helpers import json_dumps, json_dumps_indented, json_loads
 
 logger = logging.getLogger(__name__)
 
+class RouterDecision(BaseModel):
+    """Routing decision returned by the router LLM"""
+    resources: List[str]
+    intent: Literal["READ", "WRITE"]
+    confidence: float = Field(ge=0.0, le=1.0)
+    reason: str
+
 class LLMClient:
     """Client for LLM operations (router and planner)"""
     
-    def __init__(self, api_key: str):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(self, api_key: str, client: Optional[AsyncOpenAI] = None):
+        # Reuse an existing client when given so its HTTP keep-alive pool is shared
+        self.client = client or AsyncOpenAI(api_key=api_key)
     
     async def route_request(
         self, 
@@ -50,7 +60,7 @@ Respond with JSON in this exact format:
 }}"""
 
         user_prompt = f"""Natural language query: "{natural_language}"
-Hints: {json.dumps(hints) if hints else "none"}
+Hints: {json_dumps(hints) if hints else "none"}
 
 Analyze this query and return the routing decision."""
 
@@ -65,27 +75,19 @@ Analyze this query and return the routing decision."""
                 max_tokens=200
             )
             
-            result = json.loads(response.choices[0].message.content.strip())
-            
-            # Validate required fields
-            required_fields = ["resources", "intent", "confidence", "reason"]
-            if not all(field in result for field in required_fields):
-                raise ValueError("Missing required fields in router response")
-            
-            # Validate confidence range
-            if not 0.0 <= result["confidence"] <= 1.0:
-                raise ValueError("Confidence must be between 0.0 and 1.0")
-            
-            # Validate intent
-            if result["intent"] not in ["READ", "WRITE"]:
-                raise ValueError("Intent must be READ or WRITE")
+            # Parse and validate the JSON response in a single pass
+            decision = RouterDecision.model_validate_json(response.choices[0].message.content.strip())
+            result = decision.model_dump()
             
             logger.info(f"Router result: {result}")
             return result
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse router JSON response: {e}")
-            raise ValueError("Invalid JSON response from router")
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                logger.error(f"Failed to parse router JSON response: {e}")
+                raise ValueError("Invalid JSON response from router")
+            logger.error(f"Router failed: {e}")
+            raise RuntimeError(f"Router error: {str(e)}")
         except Exception as e:
             logger.error(f"Router failed: {e}")
             raise RuntimeError(f"Router error: {str(e)}")
@@ -126,7 +128,7 @@ IMPORTANT: Generate {operation_type} operations based on the natural language in
 For WRITE operations, choose between INSERT or UPDATE based on the request context.
 
 Available resources and their contracts:
-{json.dumps(contracts, indent=2)}
+{json_dumps_indented(contracts)}
 
 DSL Format Rules:
 
@@ -210,7 +212,7 @@ Generate the internal DSL:"""
                 lines = dsl_content.split('\n')
                 dsl_content = '\n'.join(lines[1:-1])
             
-            result = json.loads(dsl_content)
+            result = json_loads(dsl_content)
             
             # Basic validation
             if "steps" not in result or not isinstance(result["steps"], list):
@@ -219,10 +221,10 @@ Generate the internal DSL:"""
             if not result["steps"]:
                 raise ValueError("DSL must have at least one step")
             
-            logger.info(f"Planner result: {json.dumps(result, indent=2)}")
+            logger.info(f"Planner result: {json_dumps_indented(result)}")
             return result
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse planner JSON response: {e}")
             raise ValueError("Invalid JSON response from planner")
         except Exception as e:
@@ -238,7 +240,7 @@ def get_llm_client() -> LLMClient:
         raise RuntimeError("LLM client not initialized")
     return llm_client
 
-def init_llm_client(api_key: str) -> None:
-    """Initialize the LLM client"""
+def init_llm_client(api_key: str, client: Optional[AsyncOpenAI] = None) -> None:
+    """Initialize the LLM client, optionally on top of a shared AsyncOpenAI client"""
     global llm_client
-    llm_client = LLMClient(api_key)
\ No newline at end of file
+    llm_client = LLMClient(api_key, client)
\ No newline at end of file
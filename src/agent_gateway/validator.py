@@ -3,10 +3,12 @@ Validator component - deterministic validation of DSL against contracts
 """
 
 import logging
+import uuid
+from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
-from agent_gateway.contracts.base import ResourceContract, FilterOperator, Operation
+from agent_gateway.contracts.base import ResourceContract, FilterOperator, Operation, FieldType
 from agent_gateway.models.dsl import DSL, DSLOperation, ReadOperation, UpdateOperation, InsertOperation
 
 logger = logging.getLogger(__name__)
@@ -431,8 +433,6 @@ class Validator:
         """Validate field value matches expected type and enum constraints"""
         
         # Basic type checking - can be extended
-        from agent_gateway.contracts.base import FieldType
-        
         if value is None:
             return None  # NULL values handled by nullable flag
         
@@ -448,7 +448,6 @@ class Validator:
         field_type = field.type
         try:
             if field_type == FieldType.UUID:
-                import uuid
                 if isinstance(value, str):
                     uuid.UUID(value)  # Validate UUID format
             elif field_type == FieldType.INTEGER:
@@ -464,7 +463,6 @@ class Validator:
                             raise ValueError("Invalid boolean value")
             elif field_type in [FieldType.DATE, FieldType.TIMESTAMP]:
                 if isinstance(value, str):
-                    from datetime import datetime
                     # Basic ISO format check
                     datetime.fromisoformat(value.replace('Z', '+00:00'))
         except (ValueError, TypeError) as e:
@@ -3,7 +3,6 @@ Agent context API routes
 """
 
 import logging
-import json
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends, Query
@@ -26,38 +25,22 @@ async def create_context(
 ):
     """Create or update agent context (upsert based on case_id + agent_type + context_key)"""
     context_service = get_agent_context_service()
-    cases_service = get_cases_service()
     
     try:
-        # Verify case exists
-        case_result = await cases_service.get_case_by_id(str(request.case_id))
-        if not case_result.success or not case_result.data:
-            raise HTTPException(status_code=404, detail="Case not found")
-        
-        # Check if context already exists for upsert behavior
-        existing_result = await context_service.get_context_by_key(
-            str(request.case_id), 
-            request.agent_type.value, 
-            request.context_key
+        # Insert or update on the unique (case_id, agent_type, context_key) in one statement;
+        # a missing case surfaces as NOT_FOUND from the foreign key
+        result = await context_service.upsert_context(
+            str(request.case_id),
+            request.agent_type.value,
+            request.context_key,
+            request.context_value,
+            request.expires_at
         )
         
-        if existing_result.success and existing_result.data:
-            # Update existing context
-            context_id = existing_result.data[0]['context_id']
-            result = await context_service.update_context_value(context_id, request.context_value)
-        else:
-            # Create new context
-            expires_at_str = request.expires_at.isoformat() if request.expires_at else None
-            result = await context_service.create_context(
-                str(request.case_id),
-                request.agent_type.value,
-                request.context_key,
-                request.context_value,
-                expires_at_str
-            )
-        
         if not result.success:
-            if result.error_type == "UNAUTHORIZED_OPERATION":
+            if result.error_type == "NOT_FOUND":
+                raise HTTPException(status_code=404, detail="Case not found")
+            elif result.error_type == "UNAUTHORIZED_OPERATION":
                 raise HTTPException(status_code=403, detail=result.error)
             elif result.error_type == "INVALID_QUERY":
                 raise HTTPException(status_code=400, detail=result.error)
@@ -71,9 +54,9 @@ async def create_context(
             agent_type=AgentType(context_data['agent_type']),
             context_key=context_data['context_key'],
             context_value=context_data['context_value'],
-            expires_at=datetime.fromisoformat(context_data['expires_at'].replace('Z', '+00:00')) if context_data.get('expires_at') and isinstance(context_data['expires_at'], str) else context_data.get('expires_at'),
-            created_at=datetime.fromisoformat(context_data['created_at'].replace('Z', '+00:00')) if isinstance(context_data['created_at'], str) else context_data['created_at'],
-            updated_at=datetime.fromisoformat(context_data['updated_at'].replace('Z', '+00:00')) if isinstance(context_data['updated_at'], str) else context_data['updated_at']
+            expires_at=context_data.get('expires_at'),
+            created_at=context_data['created_at'],
+            updated_at=context_data['updated_at']
         )
         
     except HTTPException:
@@ -111,9 +94,9 @@ async def get_context(
             agent_type=AgentType(context_data['agent_type']),
             context_key=context_data['context_key'],
             context_value=context_data['context_value'],
-            expires_at=datetime.fromisoformat(context_data['expires_at'].replace('Z', '+00:00')) if context_data.get('expires_at') and isinstance(context_data['expires_at'], str) else context_data.get('expires_at'),
-            created_at=datetime.fromisoformat(context_data['created_at'].replace('Z', '+00:00')) if isinstance(context_data['created_at'], str) else context_data['created_at'],
-            updated_at=datetime.fromisoformat(context_data['updated_at'].replace('Z', '+00:00')) if isinstance(context_data['updated_at'], str) else context_data['updated_at']
+            expires_at=context_data.get('expires_at'),
+            created_at=context_data['created_at'],
+            updated_at=context_data['updated_at']
         )
         
     except HTTPException:
@@ -163,9 +146,9 @@ async def update_context(
             agent_type=AgentType(context_data['agent_type']),
             context_key=context_data['context_key'],
             context_value=context_data['context_value'],
-            expires_at=datetime.fromisoformat(context_data['expires_at'].replace('Z', '+00:00')) if context_data.get('expires_at') and isinstance(context_data['expires_at'], str) else context_data.get('expires_at'),
-            created_at=datetime.fromisoformat(context_data['created_at'].replace('Z', '+00:00')) if isinstance(context_data['created_at'], str) else context_data['created_at'],
-            updated_at=datetime.fromisoformat(context_data['updated_at'].replace('Z', '+00:00')) if isinstance(context_data['updated_at'], str) else context_data['updated_at']
+            expires_at=context_data.get('expires_at'),
+            created_at=context_data['created_at'],
+            updated_at=context_data['updated_at']
         )
             
     except HTTPException:
@@ -238,10 +221,10 @@ async def list_context(
                 case_id=row['case_id'],
                 agent_type=AgentType(row['agent_type']),
                 context_key=row['context_key'],
-                context_value=row['context_value'] if isinstance(row['context_value'], dict) else json.loads(row['context_value']) if row['context_value'] else {},
-                expires_at=datetime.fromisoformat(row['expires_at'].replace('Z', '+00:00')) if row.get('expires_at') and isinstance(row['expires_at'], str) else row.get('expires_at'),
-                created_at=datetime.fromisoformat(row['created_at'].replace('Z', '+00:00')) if isinstance(row['created_at'], str) else row['created_at'],
-                updated_at=datetime.fromisoformat(row['updated_at'].replace('Z', '+00:00')) if isinstance(row['updated_at'], str) else row['updated_at']
+                context_value=row['context_value'] or {},
+                expires_at=row.get('expires_at'),
+                created_at=row['created_at'],
+                updated_at=row['updated_at']
             ) for row in result.data
         ]
             
@@ -263,8 +246,7 @@ async def get_case_agent_context(
     
     try:
         # Verify case exists
-        case_result = await cases_service.get_case_by_id(case_id)
-        if not case_result.success or not case_result.data:
+        if not await cases_service.case_exists(case_id):
             raise HTTPException(status_code=404, detail="Case not found")
         
         # Get context for this case and agent type
@@ -285,13 +267,7 @@ async def get_case_agent_context(
         # Return as a dictionary mapping context_key to context_value
         context_map = {}
         for row in result.data:
-            context_value = row['context_value']
-            if isinstance(context_value, str):
-                try:
-                    context_value = json.loads(context_value)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            context_map[row['context_key']] = context_value or {}
+            context_map[row['context_key']] = row['context_value'] or {}
         
         return context_map
             
@@ -328,25 +304,10 @@ async def get_specific_context_value(
         context_data = result.data[0]
         context_value = context_data['context_value']
         
-        # Handle JSON parsing if needed
-        if isinstance(context_value, str):
-            try:
-                context_value = json.loads(context_value)
-            except (json.JSONDecodeError, TypeError):
-                pass
-        
-        expires_at = context_data.get('expires_at')
-        if isinstance(expires_at, str):
-            expires_at = expires_at
-        elif hasattr(expires_at, 'isoformat'):
-            expires_at = expires_at.isoformat()
-        else:
-            expires_at = None
-        
         return {
             "context_key": context_key,
             "context_value": context_value or {},
-            "expires_at": expires_at
+            "expires_at": context_data.get('expires_at')
         }
             
     except HTTPException:
@@ -409,7 +370,7 @@ async def cleanup_expired_context(
         return {
             "message": f"Cleaned up {deleted_count} expired context entries",
             "deleted_count": deleted_count,
-            "cleanup_time": datetime.utcnow().isoformat()
+            "cleanup_time": datetime.utcnow()
         }
             
     except HTTPException:
@@ -147,7 +147,7 @@ async def delete_conversation(
     agent_conversations_service = get_agent_conversations_service()
     
     try:
-        result = await agent_conversations_service.delete(conversation_id)
+        result = await agent_conversations_service.delete_conversation(conversation_id)
         
         if not result.success:
             if result.error_type == "NOT_FOUND":
@@ -4,7 +4,7 @@ Single endpoint for natural language to database operations
 """
 
 import logging
-import uuid
+import secrets
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, Any, Optional
@@ -41,7 +41,7 @@ async def agent_database_operation(
     """
     
     # Generate request ID for logging/tracing
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
     start_time = datetime.utcnow()
     
     logger.info(f"[{request_id}] Agent DB request started", extra={
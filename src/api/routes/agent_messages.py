@@ -4,7 +4,6 @@ Agent messages API routes
 
 import asyncio
 import logging
-import json
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
 
@@ -31,8 +30,7 @@ async def create_message(
     
     try:
         # Verify conversation exists
-        conv_result = await conversations_service.get_conversation_by_id(str(request.conversation_id))
-        if not conv_result.success or not conv_result.data:
+        if not await conversations_service.conversation_exists(str(request.conversation_id)):
             raise HTTPException(status_code=404, detail="Conversation not found")
         
         # Create message using service (sequence number auto-generated)
@@ -55,7 +53,8 @@ async def create_message(
             elif result.error_type in ["INVALID_QUERY", "UNAUTHORIZED_FIELD", "RESOURCE_NOT_FOUND", "UNAUTHORIZED_OPERATION"]:
                 raise HTTPException(status_code=400, detail=result.error)
             elif result.error_type == "FOREIGN_KEY_ERROR":
-                raise HTTPException(status_code=400, detail=result.error)
+                # Conversation deleted after the (cached) existence check passed
+                raise HTTPException(status_code=404, detail="Conversation not found")
             else:
                 raise HTTPException(status_code=500, detail=result.error)
         
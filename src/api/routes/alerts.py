@@ -9,7 +9,7 @@ from typing import Optional, Dict, Any
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from services.email_service import send_direct_alert
+from services.email_service import send_direct_alerts
 from services.error_log_service import ErrorLogService
 from models.error_log import ErrorLogResponse, ErrorLogStats
 from config.settings import ADMIN_ALERT_EMAILS
@@ -56,14 +56,13 @@ async def send_failure_alert(
             {f"<p><strong>Context:</strong> {request.context}</p>" if request.context else ""}
             """
             
-            # Send directly via Resend to all admin emails
-            for email in ADMIN_ALERT_EMAILS:
-                try:
-                    await send_direct_alert(email.strip(), subject, html_body)
-                    sent_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to send alert to {email}: {e}")
-                    failed_count += 1
+            # Send directly via Resend to all admin emails in a single batch request
+            recipients = [email.strip() for email in ADMIN_ALERT_EMAILS]
+            try:
+                sent_count = await send_direct_alerts(recipients, subject, html_body)
+            except Exception as e:
+                logger.error(f"Failed to send alert batch to {len(recipients)} admins: {e}")
+                failed_count = len(recipients)
             
             logger.info(f"Alert sent: {request.component} - {sent_count} sent, {failed_count} failed")
         else:
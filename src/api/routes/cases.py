@@ -5,14 +5,12 @@ No direct database access - unified with Agent Gateway architecture.
 """
 
 import logging
-from datetime import datetime, timedelta
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 
-from models.case import CaseCreateRequest, CaseUpdateRequest, CaseSearchQuery, CaseSearchResponse, DateOperator
+from models.case import CaseCreateRequest, CaseBulkCreateRequest, CaseUpdateRequest, CaseSearchQuery, CaseSearchResponse, DateOperator
 from models.enums import CaseStatus
 from services.cases_service import get_cases_service
-from services.communications_service import get_communications_service  
 from services.documents_service import get_document_analysis_service
 from utils.auth import AuthConfig
 
@@ -67,6 +65,147 @@ async def create_case(
         logger.error(f"Failed to create case: {e}")
         raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
 
+@router.post("/bulk")
+async def bulk_create_cases(
+    request: CaseBulkCreateRequest,
+    _: bool = Depends(AuthConfig.get_auth_dependency())
+):
+    """Create multiple cases in one set-based insert (all or nothing)"""
+    cases_service = get_cases_service()
+    
+    try:
+        result = await cases_service.bulk_create_cases(
+            [case.dict() for case in request.cases],
+            status=CaseStatus.OPEN.value
+        )
+        
+        if not result.success:
+            if result.error_type == "INVALID_QUERY":
+                raise HTTPException(status_code=400, detail=result.error)
+            else:
+                raise HTTPException(status_code=500, detail=result.error)
+        
+        return {
+            "created_count": result.count,
+            "cases": [
+                {
+                    "case_id": str(case_data['case_id']),
+                    "client_name": case_data['client_name'],
+                    "client_email": case_data['client_email'],
+                    "client_phone": case_data['client_phone'],
+                    "status": case_data['status']
+                } for case_data in result.data
+            ]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk create cases: {e}")
+        raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
+
+# Fixed paths are declared before /{case_id} so the path parameter does not capture them
+@router.post("/search")
+async def search_cases(
+    query: CaseSearchQuery,
+    _: bool = Depends(AuthConfig.get_auth_dependency())
+):
+    """Search cases with flexible filtering"""
+    cases_service = get_cases_service()
+    
+    try:
+        # Convert date filters to simple format for service layer
+        created_at_filter = None
+        if query.created_at:
+            created_at_filter = {
+                "operator": query.created_at.operator.value,
+                "value": query.created_at.value,
+                "end_value": getattr(query.created_at, 'end_value', None)
+            }
+        
+        last_communication_date_filter = None  
+        if query.last_communication_date:
+            last_communication_date_filter = {
+                "operator": query.last_communication_date.operator.value,
+                "value": query.last_communication_date.value,
+                "end_value": getattr(query.last_communication_date, 'end_value', None)
+            }
+        
+        # Call enhanced search service
+        result = await cases_service.search_cases(
+            client_name=query.client_name,
+            client_email=query.client_email,
+            client_phone=query.client_phone,
+            status=query.status.value if query.status else None,
+            created_at_filter=created_at_filter,
+            last_communication_date_filter=last_communication_date_filter,
+            use_fuzzy_matching=query.use_fuzzy_matching or False,
+            fuzzy_threshold=query.fuzzy_threshold or 0.3,
+            limit=query.limit,
+            offset=query.offset
+        )
+        
+        if not result.success:
+            raise HTTPException(status_code=500, detail=result.error)
+        
+        # Format results for response
+        cases = []
+        for case_data in result.data:
+            cases.append({
+                "case_id": str(case_data['case_id']),
+                "client_name": case_data['client_name'],
+                "client_email": case_data['client_email'],
+                "client_phone": case_data['client_phone'],
+                "status": case_data['status'],
+                "created_at": case_data['created_at'].isoformat() if hasattr(case_data['created_at'], 'isoformat') else case_data['created_at'],
+                "last_communication_date": case_data.get('last_communication_date')
+            })
+        
+        total_count = result.page_info.get('total_count', len(cases)) if result.page_info else len(cases)
+        
+        return CaseSearchResponse(
+            total_count=total_count,
+            cases=cases,
+            limit=query.limit,
+            offset=query.offset
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to search cases: {e}")
+        raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
+
+@router.get("/pending-reminders")
+async def get_pending_reminder_cases(
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of cases to return"),
+    after_case_id: Optional[str] = Query(None, description="Cursor: next_cursor from the previous page"),
+    _: bool = Depends(AuthConfig.get_auth_dependency())
+):
+    """Get cases that need reminder emails"""
+    cases_service = get_cases_service()
+    
+    try:
+        # Postgres returns the page, count and cursor as the finished JSON body
+        result = await cases_service.get_cases_needing_reminders_json(
+            days_since_last_contact=3,
+            limit=limit,
+            after_case_id=after_case_id
+        )
+        
+        if not result.success:
+            if result.error_type == "INVALID_QUERY":
+                raise HTTPException(status_code=400, detail=result.error)
+            raise HTTPException(status_code=500, detail=result.error)
+        
+        return Response(content=result.data[0]['payload'], media_type="application/json")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get pending cases: {e}")
+        raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
+
 @router.get("/{case_id}")
 async def get_case(
     case_id: str,
@@ -76,42 +215,22 @@ async def get_case(
     cases_service = get_cases_service()
     
     try:
-        # Get case data
-        result = await cases_service.get_case_by_id(case_id)
+        # Get case data and last communication date in one query
+        result = await cases_service.get_case_with_last_communication(case_id)
         
         if not result.success or not result.data:
             raise HTTPException(status_code=404, detail="Case not found")
         
         case_data = result.data[0]
         
-        # Get last communication date using communications service
-        from services.communications_service import get_communications_service
-        communications_service = get_communications_service()
-        
-        comm_result = await communications_service.read(
-            filters={"case_id": case_id},
-            order_by=[{"field": "created_at", "dir": "desc"}],
-            limit=1
-        )
-        
-        last_communication_date = None
-        if comm_result.success and comm_result.data:
-            last_comm = comm_result.data[0]
-            last_comm_date = last_comm.get('created_at')
-            if last_comm_date:
-                if isinstance(last_comm_date, str):
-                    last_communication_date = last_comm_date
-                else:
-                    last_communication_date = last_comm_date.isoformat()
-        
         return {
             "case_id": case_data['case_id'],
             "client_name": case_data['client_name'],
             "client_email": case_data['client_email'],
             "client_phone": case_data['client_phone'],
             "status": case_data['status'],
-            "created_at": case_data['created_at'].isoformat() if isinstance(case_data['created_at'], datetime) else case_data['created_at'],
-            "last_communication_date": last_communication_date
+            "created_at": case_data['created_at'],
+            "last_communication_date": case_data['last_communication_date']
         }
         
     except HTTPException:
@@ -220,64 +339,18 @@ async def get_case_communications(
 ):
     """Get communication history for a case"""
     cases_service = get_cases_service()
-    communications_service = get_communications_service()
     
     try:
-        # Get case details
-        case_result = await cases_service.get_case_by_id(case_id)
-        if not case_result.success:
-            if case_result.error_type == "RESOURCE_NOT_FOUND":
-                raise HTTPException(status_code=404, detail="Case not found")
-            else:
-                raise HTTPException(status_code=500, detail=case_result.error)
-        
-        case_data = case_result.data[0]
-        
-        # Get communications for this case
-        comm_result = await communications_service.get_communications_by_case(case_id)
-        
-        if not comm_result.success:
-            logger.warning(f"Failed to get communications for case {case_id}: {comm_result.error}")
-            communications = []
-        else:
-            communications = comm_result.data
-        
-        # Build response with unified service data
-        last_comm_date = None
-        if communications:
-            # Sort by created_at and get the most recent
-            sorted_comms = sorted(communications, key=lambda x: x.get('created_at', ''), reverse=True)
-            if sorted_comms:
-                last_comm_date = sorted_comms[0].get('created_at')
+        # Postgres returns the case and its communications as the finished JSON body
+        result = await cases_service.get_case_communications_json(case_id)
+        if not result.success:
+            if result.error_type == "INVALID_QUERY":
+                raise HTTPException(status_code=400, detail=result.error)
+            raise HTTPException(status_code=500, detail=result.error)
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Case not found")
         
-        return {
-            "case_id": case_id,
-            "client_name": case_data['client_name'],
-            "client_email": case_data['client_email'],
-            "client_phone": case_data['client_phone'],
-            "case_status": case_data['status'],
-            "last_communication_date": last_comm_date,
-            "communication_summary": {
-                "total_communications": len(communications),
-                "last_communication_date": last_comm_date
-            },
-            "communications": [
-                {
-                    "communication_id": str(comm['communication_id']),
-                    "channel": comm['channel'],
-                    "direction": comm['direction'],
-                    "status": comm['status'],
-                    "opened_at": comm.get('opened_at'),
-                    "sender": comm['sender'],
-                    "recipient": comm['recipient'],
-                    "subject": comm['subject'],
-                    "message_content": comm['message_content'],
-                    "created_at": comm['created_at'],
-                    "sent_at": comm.get('sent_at'),
-                    "resend_id": comm.get('resend_id')
-                } for comm in communications
-            ]
-        }
+        return Response(content=result.data[0]['payload'], media_type="application/json")
         
     except HTTPException:
         raise
@@ -288,13 +361,15 @@ async def get_case_communications(
 @router.get("/{case_id}/analysis-summary")
 async def get_case_analysis_summary(
     case_id: str,
+    limit: int = Query(50, ge=1, le=50, description="Maximum number of analysis records to include"),
+    offset: int = Query(0, ge=0, description="Number of analysis records to skip"),
     _: bool = Depends(AuthConfig.get_auth_dependency())
 ):
     """Get analysis summary for all documents in a case"""
     cases_service = get_cases_service()
     
     try:
-        result = await cases_service.get_case_analysis_summary(case_id)
+        result = await cases_service.get_case_analysis_summary(case_id, limit=limit, offset=offset)
         
         if not result.success:
             if result.error_type == "RESOURCE_NOT_FOUND":
@@ -310,77 +385,6 @@ async def get_case_analysis_summary(
         logger.error(f"Failed to get case analysis summary: {e}")
         raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
 
-@router.post("/search")
-async def search_cases(
-    query: CaseSearchQuery,
-    _: bool = Depends(AuthConfig.get_auth_dependency())
-):
-    """Search cases with flexible filtering"""
-    cases_service = get_cases_service()
-    
-    try:
-        # Convert date filters to simple format for service layer
-        created_at_filter = None
-        if query.created_at:
-            created_at_filter = {
-                "operator": query.created_at.operator.value,
-                "value": query.created_at.value,
-                "end_value": getattr(query.created_at, 'end_value', None)
-            }
-        
-        last_communication_date_filter = None  
-        if query.last_communication_date:
-            last_communication_date_filter = {
-                "operator": query.last_communication_date.operator.value,
-                "value": query.last_communication_date.value,
-                "end_value": getattr(query.last_communication_date, 'end_value', None)
-            }
-        
-        # Call enhanced search service
-        result = await cases_service.search_cases(
-            client_name=query.client_name,
-            client_email=query.client_email,
-            client_phone=query.client_phone,
-            status=query.status.value if query.status else None,
-            created_at_filter=created_at_filter,
-            last_communication_date_filter=last_communication_date_filter,
-            use_fuzzy_matching=query.use_fuzzy_matching or False,
-            fuzzy_threshold=query.fuzzy_threshold or 0.3,
-            limit=query.limit,
-            offset=query.offset
-        )
-        
-        if not result.success:
-            raise HTTPException(status_code=500, detail=result.error)
-        
-        # Format results for response
-        cases = []
-        for case_data in result.data:
-            cases.append({
-                "case_id": str(case_data['case_id']),
-                "client_name": case_data['client_name'],
-                "client_email": case_data['client_email'],
-                "client_phone": case_data['client_phone'],
-                "status": case_data['status'],
-                "created_at": case_data['created_at'].isoformat() if hasattr(case_data['created_at'], 'isoformat') else case_data['created_at'],
-                "last_communication_date": case_data.get('last_communication_date')
-            })
-        
-        total_count = result.page_info.get('total_count', len(cases)) if result.page_info else len(cases)
-        
-        return CaseSearchResponse(
-            total_count=total_count,
-            cases=cases,
-            limit=query.limit,
-            offset=query.offset
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to search cases: {e}")
-        raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
-
 @router.get("")
 async def list_cases(
     limit: int = Query(50, ge=1, le=500, description="Maximum number of results"),
@@ -426,27 +430,3 @@ async def list_cases(
     except Exception as e:
         logger.error(f"Failed to list cases: {e}")
         raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
-
-@router.get("/pending-reminders")
-async def get_pending_reminder_cases(
-    _: bool = Depends(AuthConfig.get_auth_dependency())
-):
-    """Get cases that need reminder emails"""
-    cases_service = get_cases_service()
-    
-    try:
-        result = await cases_service.get_cases_needing_reminders(days_since_last_contact=3)
-        
-        if not result.success:
-            raise HTTPException(status_code=500, detail=result.error)
-        
-        cases = result.data[:20]  # Limit to 20 like the original implementation
-        
-        return {"found_cases": len(cases), "cases": cases}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get pending cases: {e}")
-        raise HTTPException(status_code=500, detail=f"Service error: {str(e)}")
-
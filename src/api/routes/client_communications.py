@@ -3,9 +3,9 @@ Client communications API routes
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from pydantic import TypeAdapter
 
 from models.communication import (
     ClientCommunicationCreateRequest, 
@@ -20,6 +20,9 @@ from utils.auth import AuthConfig
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Validates service rows and emits the list response JSON in one pass through pydantic-core
+_communication_list_adapter = TypeAdapter(List[ClientCommunicationResponse])
+
 @router.post("", response_model=ClientCommunicationResponse)
 async def create_communication(
     request: ClientCommunicationCreateRequest,
@@ -31,8 +34,7 @@ async def create_communication(
     
     try:
         # Verify case exists
-        case_result = await cases_service.get_case_by_id(request.case_id)
-        if not case_result.success or not case_result.data:
+        if not await cases_service.case_exists(request.case_id):
             raise HTTPException(status_code=404, detail="Case not found")
         
         # Convert sent_at to ISO string if needed
@@ -54,6 +56,9 @@ async def create_communication(
         if not result.success:
             if result.error_type == "UNAUTHORIZED_OPERATION":
                 raise HTTPException(status_code=403, detail=result.error)
+            elif result.error_type == "FOREIGN_KEY_ERROR":
+                # Case deleted after the (cached) existence check passed
+                raise HTTPException(status_code=404, detail="Case not found")
             elif result.error_type == "INVALID_QUERY":
                 raise HTTPException(status_code=400, detail=result.error)
             else:
@@ -70,9 +75,9 @@ async def create_communication(
             recipient=communication_data['recipient'],
             subject=communication_data['subject'],
             message_content=communication_data['message_content'],
-            created_at=datetime.fromisoformat(communication_data['created_at'].replace('Z', '+00:00')) if isinstance(communication_data['created_at'], str) else communication_data['created_at'],
-            sent_at=datetime.fromisoformat(communication_data['sent_at'].replace('Z', '+00:00')) if communication_data.get('sent_at') and isinstance(communication_data['sent_at'], str) else communication_data.get('sent_at'),
-            opened_at=datetime.fromisoformat(communication_data['opened_at'].replace('Z', '+00:00')) if communication_data.get('opened_at') and isinstance(communication_data['opened_at'], str) else communication_data.get('opened_at'),
+            created_at=communication_data['created_at'],
+            sent_at=communication_data.get('sent_at'),
+            opened_at=communication_data.get('opened_at'),
             resend_id=communication_data['resend_id']
         )
         
@@ -117,9 +122,9 @@ async def get_communication(
             recipient=communication_data['recipient'],
             subject=communication_data['subject'],
             message_content=communication_data['message_content'],
-            created_at=datetime.fromisoformat(communication_data['created_at'].replace('Z', '+00:00')) if isinstance(communication_data['created_at'], str) else communication_data['created_at'],
-            sent_at=datetime.fromisoformat(communication_data['sent_at'].replace('Z', '+00:00')) if communication_data.get('sent_at') and isinstance(communication_data['sent_at'], str) else communication_data.get('sent_at'),
-            opened_at=datetime.fromisoformat(communication_data['opened_at'].replace('Z', '+00:00')) if communication_data.get('opened_at') and isinstance(communication_data['opened_at'], str) else communication_data.get('opened_at'),
+            created_at=communication_data['created_at'],
+            sent_at=communication_data.get('sent_at'),
+            opened_at=communication_data.get('opened_at'),
             resend_id=communication_data['resend_id']
         )
         
@@ -204,9 +209,9 @@ async def update_communication(
             recipient=updated_comm['recipient'],
             subject=updated_comm['subject'],
             message_content=updated_comm['message_content'],
-            created_at=datetime.fromisoformat(updated_comm['created_at'].replace('Z', '+00:00')) if isinstance(updated_comm['created_at'], str) else updated_comm['created_at'],
-            sent_at=datetime.fromisoformat(updated_comm['sent_at'].replace('Z', '+00:00')) if updated_comm.get('sent_at') and isinstance(updated_comm['sent_at'], str) else updated_comm.get('sent_at'),
-            opened_at=datetime.fromisoformat(updated_comm['opened_at'].replace('Z', '+00:00')) if updated_comm.get('opened_at') and isinstance(updated_comm['opened_at'], str) else updated_comm.get('opened_at'),
+            created_at=updated_comm['created_at'],
+            sent_at=updated_comm.get('sent_at'),
+            opened_at=updated_comm.get('opened_at'),
             resend_id=updated_comm['resend_id']
         )
         
@@ -281,23 +286,11 @@ async def list_communications(
             else:
                 raise HTTPException(status_code=500, detail=result.error)
         
-        return [
-            ClientCommunicationResponse(
-                communication_id=comm['communication_id'],
-                case_id=comm['case_id'],
-                channel=CommunicationChannel(comm['channel']),
-                direction=CommunicationDirection(comm['direction']),
-                status=DeliveryStatus(comm['status']),
-                sender=comm['sender'],
-                recipient=comm['recipient'],
-                subject=comm['subject'],
-                message_content=comm['message_content'],
-                created_at=datetime.fromisoformat(comm['created_at'].replace('Z', '+00:00')) if isinstance(comm['created_at'], str) else comm['created_at'],
-                sent_at=datetime.fromisoformat(comm['sent_at'].replace('Z', '+00:00')) if comm.get('sent_at') and isinstance(comm['sent_at'], str) else comm.get('sent_at'),
-                opened_at=datetime.fromisoformat(comm['opened_at'].replace('Z', '+00:00')) if comm.get('opened_at') and isinstance(comm['opened_at'], str) else comm.get('opened_at'),
-                resend_id=comm['resend_id']
-            ) for comm in result.data
-        ]
+        communications = _communication_list_adapter.validate_python(result.data)
+        return Response(
+            content=_communication_list_adapter.dump_json(communications),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
@@ -2,11 +2,13 @@
 Document-related API routes
 """
 
+import asyncio
 import logging
+import os
 import time
 import re
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Depends
 
 from models.document import (
@@ -37,6 +39,12 @@ from utils.error_handling import set_endpoint_context, log_business_error
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Per-record fallback stores run at most this many at once, so one failed bulk
+# request cannot take over the connection pool (DB_POOL_MAX_SIZE, default 25)
+BULK_FALLBACK_CONCURRENCY = 4
+
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+
 
 def normalize_filename(filename: str) -> str:
     """
@@ -51,11 +59,11 @@ def normalize_filename(filename: str) -> str:
     if not filename:
         return ""
     
-    # Remove file extensions
-    name_without_ext = re.sub(r'\.[^.]*$', '', filename)
+    # Remove file extension (dotfiles like ".bashrc" keep their name)
+    name_without_ext, _ = os.path.splitext(filename)
     
     # Remove special characters, keep only alphanumeric
-    normalized = re.sub(r'[^a-zA-Z0-9]', '', name_without_ext)
+    normalized = _NON_ALNUM_RE.sub('', name_without_ext)
     
     return normalized.lower()
 
@@ -71,9 +79,11 @@ def calculate_filename_similarity(pattern: str, original: str) -> float:
     Returns:
         Similarity score between 0.0 and 1.0
     """
-    normalized_pattern = normalize_filename(pattern)
-    normalized_original = normalize_filename(original)
-    
+    return _normalized_similarity(normalize_filename(pattern), normalize_filename(original))
+
+
+def _normalized_similarity(normalized_pattern: str, normalized_original: str) -> float:
+    """Score two filenames that have already been through normalize_filename"""
     if not normalized_pattern or not normalized_original:
         return 0.0
     
@@ -93,9 +103,6 @@ def calculate_filename_similarity(pattern: str, original: str) -> float:
     pattern_set = set(normalized_pattern)
     original_set = set(normalized_original)
     
-    if not pattern_set and not original_set:
-        return 0.0
-    
     intersection = len(pattern_set.intersection(original_set))
     union = len(pattern_set.union(original_set))
     
@@ -116,14 +123,28 @@ def find_best_document_match(pattern: str, documents: List[Dict[str, Any]]) -> O
     Returns:
         Best matching document record or None
     """
-    if not documents:
-        return None
+    normalized_documents = [
+        (normalize_filename(doc.get('original_file_name', '')), doc) for doc in documents
+    ]
+    best_match, _ = _best_normalized_match(normalize_filename(pattern), normalized_documents)
+    return best_match
+
+
+def _best_normalized_match(
+    normalized_pattern: str,
+    normalized_documents: List[Tuple[str, Dict[str, Any]]]
+) -> Tuple[Optional[Dict[str, Any]], float]:
+    """
+    Find the best match among (normalized filename, document) pairs.
     
+    Returns:
+        (best matching document or None, its similarity score)
+    """
     best_match = None
     best_score = 0.0
     
-    for doc in documents:
-        score = calculate_filename_similarity(pattern, doc.get('original_file_name', ''))
+    for normalized_original, doc in normalized_documents:
+        score = _normalized_similarity(normalized_pattern, normalized_original)
         
         if score > best_score:
             best_score = score
@@ -131,9 +152,9 @@ def find_best_document_match(pattern: str, documents: List[Dict[str, Any]]) -> O
     
     # Only return matches with sufficient confidence
     if best_score >= 0.5:
-        return best_match
+        return best_match, best_score
     
-    return None
+    return None, 0.0
 
 
 @router.post("", response_model=DocumentCreateResponse)
@@ -156,8 +177,7 @@ async def create_document(
     
     try:
         # Validate case exists
-        case_result = await cases_service.get_case_by_id(request.case_id)
-        if not case_result.success or not case_result.data:
+        if not await cases_service.case_exists(request.case_id):
             raise HTTPException(
                 status_code=404, 
                 detail=f"Case {request.case_id} not found"
@@ -184,6 +204,12 @@ async def create_document(
                     status_code=409,
                     detail="Document with same identifiers already exists"
                 )
+            elif result.error_type == "FOREIGN_KEY_ERROR":
+                # Case deleted after the (cached) existence check passed
+                raise HTTPException(
+                    status_code=404, 
+                    detail=f"Case {request.case_id} not found"
+                )
             elif result.error_type == "INVALID_QUERY":
                 raise HTTPException(
                     status_code=400,
@@ -207,7 +233,7 @@ async def create_document(
             case_id=document_data['case_id'],
             original_file_name=document_data['original_file_name'],
             status=document_data['status'],
-            created_at=datetime.fromisoformat(document_data['created_at'].replace('Z', '+00:00')) if isinstance(document_data['created_at'], str) else document_data['created_at']
+            created_at=document_data['created_at']
         )
         
     except HTTPException:
@@ -248,14 +274,6 @@ async def update_document(
         )
     
     try:
-        # First check if document exists
-        doc_result = await documents_service.get_by_id(document_id)
-        if not doc_result.success or not doc_result.data:
-            raise HTTPException(
-                status_code=404, 
-                detail=f"Document {document_id} not found"
-            )
-        
         # Filter out None values for the update
         filtered_update_data = {k: v for k, v in update_data.items() if v is not None}
         
@@ -265,7 +283,8 @@ async def update_document(
                 detail="No valid fields provided for update"
             )
         
-        # Update document using service
+        # Single UPDATE ... RETURNING; a missing document surfaces as NOT_FOUND,
+        # so no separate existence SELECT is needed
         result = await documents_service.update(document_id, filtered_update_data)
         
         if not result.success:
@@ -347,22 +366,22 @@ async def lookup_documents_by_batch(
         
         logger.info(f"Found {len(batch_docs_list)} documents for batch {request.batch_id}")
         
+        # Normalize each batch filename once rather than once per processed file
+        normalized_docs = [
+            (normalize_filename(doc.get('original_file_name', '')), doc) for doc in batch_docs_list
+        ]
+        
         # Process each file and find matches
         mappings = []
         found_count = 0
         
         for processed_file in request.processed_files:
-            match = find_best_document_match(
-                processed_file.original_filename_pattern,
-                batch_docs_list
+            match, confidence = _best_normalized_match(
+                normalize_filename(processed_file.original_filename_pattern),
+                normalized_docs
             )
             
             if match:
-                confidence = calculate_filename_similarity(
-                    processed_file.original_filename_pattern,
-                    match['original_file_name']
-                )
-                
                 mapping = DocumentMapping(
                     file_key=processed_file.file_key,
                     document_id=str(match['document_id']),
@@ -425,8 +444,6 @@ async def bulk_store_document_analysis(
     set_endpoint_context("bulk_analysis_storage")
     start_time = time.time()
     document_analysis_service = get_document_analysis_service()
-    documents_service = get_documents_service()
-    cases_service = get_cases_service()
     
     logger.info(f"Processing bulk analysis: {len(request.analyses)} records")
     
@@ -440,90 +457,103 @@ async def bulk_store_document_analysis(
         
         logger.debug(f"Validating {len(document_ids)} documents, {len(case_ids)} cases")
         
-        # Validate documents exist
-        valid_document_ids = set()
-        for doc_id in document_ids:
-            doc_result = await documents_service.get_by_id(doc_id)
-            if doc_result.success and doc_result.data:
-                valid_document_ids.add(doc_id)
-        
-        # Validate cases exist
-        valid_case_ids = set()
-        for case_id in case_ids:
-            case_result = await cases_service.get_case_by_id(case_id)
-            if case_result.success and case_result.data:
-                valid_case_ids.add(case_id)
+        # Validate documents and cases exist with one batched query
+        valid_document_ids, valid_case_ids = await document_analysis_service.get_existing_document_and_case_ids(
+            document_ids, case_ids
+        )
         
         logger.info(f"Validation complete: {len(valid_document_ids)}/{len(document_ids)} documents, "
                    f"{len(valid_case_ids)}/{len(case_ids)} cases found")
         
-        # Process each analysis record
+        # Validate each analysis record
+        valid_records = []
         for i, analysis in enumerate(request.analyses):
-            try:
-                # Validate document exists
-                if analysis.document_id not in valid_document_ids:
-                    logger.warning(f"Document not found: {analysis.document_id}")
-                    failed_records.append(AnalysisFailure(
-                        index=i,
-                        record_id=str(analysis.document_id),
-                        error=f"Document {analysis.document_id} not found",
-                        error_code="DOCUMENT_NOT_FOUND"
-                    ))
-                    continue
-                
-                # Validate case exists
-                if analysis.case_id not in valid_case_ids:
-                    logger.warning(f"Case not found: {analysis.case_id}")
-                    failed_records.append(AnalysisFailure(
-                        index=i,
-                        record_id=str(analysis.case_id),
-                        error=f"Case {analysis.case_id} not found",
-                        error_code="CASE_NOT_FOUND"
-                    ))
-                    continue
-                
-                # Create analysis using service
-                analysis_result = await document_analysis_service.create_analysis(
-                    document_id=analysis.document_id,
-                    case_id=analysis.case_id,
-                    analysis_content=analysis.analysis_content,
-                    model_used=analysis.model_used,
-                    tokens_used=analysis.tokens_used,
-                    analysis_reasoning=analysis.analysis_reasoning,
-                    analysis_status=analysis.analysis_status
-                )
-                
-                if not analysis_result.success:
-                    logger.error(f"Failed to create analysis for document {analysis.document_id}: {analysis_result.error}")
-                    failed_records.append(AnalysisFailure(
-                        index=i,
-                        record_id=str(analysis.document_id),
-                        error=analysis_result.error,
-                        error_code="STORAGE_ERROR"
-                    ))
-                    continue
-                
-                # Update document status to completed
-                update_result = await documents_service.update_document_status(
-                    analysis.document_id, 
-                    'COMPLETED'
-                )
-                
-                if not update_result.success:
-                    logger.warning(f"Failed to update document status for {analysis.document_id}: {update_result.error}")
-                    # Don't fail the entire analysis creation for this
-                
-                inserted_count += 1
-                
-            except Exception as record_error:
-                logger.error(f"Failed to store analysis record {i}: {record_error}")
+            if str(analysis.document_id) not in valid_document_ids:
+                logger.warning(f"Document not found: {analysis.document_id}")
                 failed_records.append(AnalysisFailure(
                     index=i,
                     record_id=str(analysis.document_id),
-                    error=str(record_error),
-                    error_code="STORAGE_ERROR"
+                    error=f"Document {analysis.document_id} not found",
+                    error_code="DOCUMENT_NOT_FOUND"
                 ))
                 continue
+            
+            if str(analysis.case_id) not in valid_case_ids:
+                logger.warning(f"Case not found: {analysis.case_id}")
+                failed_records.append(AnalysisFailure(
+                    index=i,
+                    record_id=str(analysis.case_id),
+                    error=f"Case {analysis.case_id} not found",
+                    error_code="CASE_NOT_FOUND"
+                ))
+                continue
+            
+            valid_records.append((i, analysis))
+        
+        # Store all valid records (and mark their documents completed) in one transaction
+        bulk_result = await document_analysis_service.store_bulk_analysis([
+            {
+                "document_id": analysis.document_id,
+                "case_id": analysis.case_id,
+                "analysis_content": analysis.analysis_content,
+                "model_used": analysis.model_used,
+                "analysis_status": analysis.analysis_status.value,
+                "tokens_used": analysis.tokens_used,
+                "analysis_reasoning": analysis.analysis_reasoning
+            }
+            for _, analysis in valid_records
+        ])
+        
+        if bulk_result.success:
+            inserted_count = bulk_result.count
+        else:
+            # Fall back to per-record storage so a bad record only fails itself;
+            # records are independent, so a few are stored concurrently
+            logger.warning(f"Bulk insert failed, retrying per record: {bulk_result.error}")
+            fallback_slots = asyncio.Semaphore(BULK_FALLBACK_CONCURRENCY)
+            
+            async def store_record(i: int, analysis: BulkAnalysisRecord) -> Optional[AnalysisFailure]:
+                try:
+                    # Insert and mark the document COMPLETED in a single statement
+                    async with fallback_slots:
+                        analysis_result = await document_analysis_service.store_analysis_result(
+                            document_id=analysis.document_id,
+                            case_id=analysis.case_id,
+                            analysis_content=analysis.analysis_content,
+                            model_used=analysis.model_used,
+                            tokens_used=analysis.tokens_used,
+                            analysis_reasoning=analysis.analysis_reasoning,
+                            analysis_status=analysis.analysis_status.value
+                        )
+                    
+                    if not analysis_result.success:
+                        logger.error(f"Failed to create analysis for document {analysis.document_id}: {analysis_result.error}")
+                        return AnalysisFailure(
+                            index=i,
+                            record_id=str(analysis.document_id),
+                            error=analysis_result.error,
+                            error_code="STORAGE_ERROR"
+                        )
+                    
+                    return None
+                    
+                except Exception as record_error:
+                    logger.error(f"Failed to store analysis record {i}: {record_error}")
+                    return AnalysisFailure(
+                        index=i,
+                        record_id=str(analysis.document_id),
+                        error=str(record_error),
+                        error_code="STORAGE_ERROR"
+                    )
+            
+            record_failures = await asyncio.gather(
+                *(store_record(i, analysis) for i, analysis in valid_records)
+            )
+            for failure in record_failures:
+                if failure is None:
+                    inserted_count += 1
+                else:
+                    failed_records.append(failure)
         
         processing_time = int((time.time() - start_time) * 1000)
         
@@ -547,6 +577,8 @@ async def bulk_store_document_analysis(
             processing_time_ms=processing_time
         )
                 
+    except HTTPException:
+        raise
     except Exception as e:
         processing_time = int((time.time() - start_time) * 1000)
         logger.error(f"Bulk analysis storage failed: {e}")
@@ -566,32 +598,25 @@ async def store_document_analysis(
 ):
     """Store document analysis results"""
     document_analysis_service = get_document_analysis_service()
-    documents_service = get_documents_service()
-    cases_service = get_cases_service()
     
     try:
-        # Verify document exists
-        doc_result = await documents_service.get_by_id(document_id)
-        if not doc_result.success or not doc_result.data:
-            raise HTTPException(status_code=404, detail="Document not found")
-        
-        # Verify case exists
-        case_result = await cases_service.get_case_by_id(request.case_id)
-        if not case_result.success or not case_result.data:
-            raise HTTPException(status_code=404, detail="Case not found")
-        
-        # Create analysis using service
-        analysis_result = await document_analysis_service.create_analysis(
+        # Insert the analysis and mark the document COMPLETED in one round trip;
+        # missing documents/cases surface as NOT_FOUND from the foreign keys
+        analysis_result = await document_analysis_service.store_analysis_result(
             document_id=document_id,
-            case_id=request.case_id,
+            case_id=str(request.case_id),
             analysis_content=request.analysis_content,
             model_used=request.model_used,
             tokens_used=request.tokens_used,
             analysis_reasoning=request.analysis_reasoning,
-            analysis_status=request.analysis_status
+            analysis_status=request.analysis_status.value
         )
         
         if not analysis_result.success:
+            if analysis_result.error_type == "NOT_FOUND":
+                raise HTTPException(status_code=404, detail=analysis_result.error)
+            elif analysis_result.error_type == "INVALID_QUERY":
+                raise HTTPException(status_code=400, detail=f"Invalid request: {analysis_result.error}")
             logger.error(f"Failed to create analysis: {analysis_result.error}")
             raise HTTPException(
                 status_code=500,
@@ -600,12 +625,6 @@ async def store_document_analysis(
         
         analysis_data = analysis_result.data[0]
         
-        # Update document status to completed
-        update_result = await documents_service.update_document_status(document_id, 'COMPLETED')
-        if not update_result.success:
-            logger.warning(f"Failed to update document status: {update_result.error}")
-            # Don't fail the entire operation for this
-        
         logger.info(f"Stored analysis result {analysis_data['analysis_id']} for document {document_id}")
         
         return AnalysisResultResponse(
@@ -613,7 +632,7 @@ async def store_document_analysis(
             document_id=document_id,
             case_id=request.case_id,
             status="stored",
-            analyzed_at=datetime.utcnow().isoformat()
+            analyzed_at=analysis_data['analyzed_at']  # the timestamp actually stored on the row
         )
             
     except HTTPException:
@@ -645,15 +664,8 @@ async def get_document_analysis(
             raise HTTPException(status_code=404, detail="Analysis not found for document")
         
         # Get the most recent analysis (first one since we order by analyzed_at DESC in service)
-        analysis = result.data[0]
-        
-        # Convert timestamps to ISO format
-        for field in ['analyzed_at', 'created_at']:
-            if analysis.get(field):
-                if hasattr(analysis[field], 'isoformat'):
-                    analysis[field] = analysis[field].isoformat()
-        
-        return analysis
+        # Timestamps are already ISO strings from the service layer
+        return result.data[0]
             
     except HTTPException:
         raise
@@ -686,15 +698,8 @@ async def get_document(
         if not result.data:
             raise HTTPException(status_code=404, detail="Document not found")
         
-        document = result.data[0]
-        
-        # Convert timestamps to ISO format
-        for field in ['created_at']:
-            if document.get(field):
-                if hasattr(document[field], 'isoformat'):
-                    document[field] = document[field].isoformat()
-        
-        return document
+        # Timestamps are already ISO strings from the service layer
+        return result.data[0]
             
     except HTTPException:
         raise
@@ -723,8 +728,7 @@ async def get_all_analyses_by_case(
     
     try:
         # Validate case exists
-        case_result = await cases_service.get_case_by_id(case_id)
-        if not case_result.success or not case_result.data:
+        if not await cases_service.case_exists(case_id):
             raise HTTPException(status_code=404, detail=f"Case {case_id} not found")
         
         # Get all analyses for the case
@@ -740,7 +744,7 @@ async def get_all_analyses_by_case(
         analyses_data = analyses_result.data or []
         
         # Get aggregated analysis data which includes total tokens
-        aggregated_result = await document_analysis_service.get_aggregated_analysis(case_id)
+        aggregated_result = await document_analysis_service.get_aggregated_analysis(case_id, include_analyses=False)
         total_tokens = None
         if aggregated_result.success and aggregated_result.data:
             total_tokens = aggregated_result.data[0].get('total_tokens_used')
@@ -797,12 +801,11 @@ async def get_aggregated_analysis_summary(
     
     try:
         # Validate case exists
-        case_result = await cases_service.get_case_by_id(case_id)
-        if not case_result.success or not case_result.data:
+        if not await cases_service.case_exists(case_id):
             raise HTTPException(status_code=404, detail=f"Case {case_id} not found")
         
         # Get aggregated analysis data
-        aggregated_result = await document_analysis_service.get_aggregated_analysis(case_id)
+        aggregated_result = await document_analysis_service.get_aggregated_analysis(case_id, include_analyses=False)
         
         if not aggregated_result.success:
             logger.error(f"Failed to get aggregated analysis for case {case_id}: {aggregated_result.error}")
@@ -826,19 +829,8 @@ async def get_aggregated_analysis_summary(
         
         aggregated_data = aggregated_result.data[0]
         
-        # Get all analyses to compute additional stats that service doesn't provide
-        analyses_result = await document_analysis_service.get_analyses_by_case(case_id)
-        
-        earliest_analysis = None
-        latest_analysis = None
-        if analyses_result.success and analyses_result.data:
-            analyses = analyses_result.data
-            if analyses:
-                # Find earliest and latest
-                dates = [a.get('analyzed_at') for a in analyses if a.get('analyzed_at')]
-                if dates:
-                    earliest_analysis = min(dates)
-                    latest_analysis = max(dates)
+        earliest_analysis = aggregated_data.get('earliest_analysis')
+        latest_analysis = aggregated_data.get('latest_analysis')
         
         # Prepare aggregated insights
         aggregated_insights = None
@@ -894,12 +886,8 @@ async def update_document_analysis(
     logger.info(f"Updating analysis {analysis_id} with fields: {list(update_data.keys())}")
     
     try:
-        # First check if analysis exists
-        analysis_result = await document_analysis_service.get_by_id(analysis_id)
-        if not analysis_result.success or not analysis_result.data:
-            raise HTTPException(status_code=404, detail="Analysis not found")
-        
-        # Update the analysis using service
+        # Update the analysis using service; a missing analysis comes back as NOT_FOUND,
+        # so the (potentially large) existing analysis_content is never fetched first
         result = await document_analysis_service.update(analysis_id, update_data)
         
         if not result.success:
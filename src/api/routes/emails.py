@@ -2,7 +2,7 @@
 Email management API routes
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from models.email import EmailRequest
 from services.email_service import send_email_via_resend
 from utils.auth import AuthConfig
@@ -12,7 +12,8 @@ router = APIRouter()
 @router.post("/send-email")
 async def send_email(
     request: EmailRequest,
+    background_tasks: BackgroundTasks,
     _: bool = Depends(AuthConfig.get_auth_dependency())
 ):
-    """Send email via Resend"""
-    return await send_email_via_resend(request)
\ No newline at end of file
+    """Send email via Resend; the communication log is written after the response"""
+    return await send_email_via_resend(request, background_tasks)
\ No newline at end of file
@@ -57,6 +57,8 @@ async def suspend_server(
             suspension_info=suspension_manager.get_suspension_info()
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error during suspension: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to suspend server: {str(e)}")
@@ -85,6 +87,8 @@ async def resume_server(
             suspension_info=suspension_manager.get_suspension_info()
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error during resume: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to resume server: {str(e)}")
@@ -32,7 +32,7 @@ async def create_error_log(
         result = await error_service.log_error(
             component=request.component,
             error_message=request.error_message,
-            severity=request.severity.value,
+            severity=request.severity,
             context=request.context,
             email_sent=request.email_sent
         )
@@ -52,11 +52,11 @@ async def create_error_log(
             error_id=error_log['error_id'],
             component=error_log['component'],
             error_message=error_log['error_message'],
-            severity=ErrorSeverity(error_log['severity']),
+            severity=error_log['severity'],
             context=error_log['context'],
             email_sent=error_log['email_sent'],
-            created_at=datetime.fromisoformat(error_log['created_at'].replace('Z', '+00:00')) if isinstance(error_log['created_at'], str) else error_log['created_at'],
-            updated_at=datetime.fromisoformat(error_log['updated_at'].replace('Z', '+00:00')) if isinstance(error_log['updated_at'], str) else error_log['updated_at']
+            created_at=error_log['created_at'],
+            updated_at=error_log['updated_at']
         )
         
     except HTTPException:
@@ -92,11 +92,11 @@ async def get_error_log(
             error_id=error_log['error_id'],
             component=error_log['component'],
             error_message=error_log['error_message'],
-            severity=ErrorSeverity(error_log['severity']),
+            severity=error_log['severity'],
             context=error_log['context'],
             email_sent=error_log['email_sent'],
-            created_at=datetime.fromisoformat(error_log['created_at'].replace('Z', '+00:00')) if isinstance(error_log['created_at'], str) else error_log['created_at'],
-            updated_at=datetime.fromisoformat(error_log['updated_at'].replace('Z', '+00:00')) if isinstance(error_log['updated_at'], str) else error_log['updated_at']
+            created_at=error_log['created_at'],
+            updated_at=error_log['updated_at']
         )
         
     except HTTPException:
@@ -123,7 +123,7 @@ async def update_error_log(
         if request.error_message is not None:
             update_data["error_message"] = request.error_message
         if request.severity is not None:
-            update_data["severity"] = request.severity.value
+            update_data["severity"] = request.severity
         if request.context is not None:
             update_data["context"] = request.context
         if request.email_sent is not None:
@@ -151,11 +151,11 @@ async def update_error_log(
             error_id=error_log['error_id'],
             component=error_log['component'],
             error_message=error_log['error_message'],
-            severity=ErrorSeverity(error_log['severity']),
+            severity=error_log['severity'],
             context=error_log['context'],
             email_sent=error_log['email_sent'],
-            created_at=datetime.fromisoformat(error_log['created_at'].replace('Z', '+00:00')) if isinstance(error_log['created_at'], str) else error_log['created_at'],
-            updated_at=datetime.fromisoformat(error_log['updated_at'].replace('Z', '+00:00')) if isinstance(error_log['updated_at'], str) else error_log['updated_at']
+            created_at=error_log['created_at'],
+            updated_at=error_log['updated_at']
         )
         
     except HTTPException:
@@ -223,7 +223,7 @@ async def list_error_logs(
         if component:
             filters["component"] = component
         if severity:
-            filters["severity"] = severity.value
+            filters["severity"] = severity
         if email_sent is not None:
             filters["email_sent"] = email_sent
         
@@ -242,11 +242,11 @@ async def list_error_logs(
                 error_id=log['error_id'],
                 component=log['component'],
                 error_message=log['error_message'],
-                severity=ErrorSeverity(log['severity']),
+                severity=log['severity'],
                 context=log['context'],
                 email_sent=log['email_sent'],
-                created_at=datetime.fromisoformat(log['created_at'].replace('Z', '+00:00')) if isinstance(log['created_at'], str) else log['created_at'],
-                updated_at=datetime.fromisoformat(log['updated_at'].replace('Z', '+00:00')) if isinstance(log['updated_at'], str) else log['updated_at']
+                created_at=log['created_at'],
+                updated_at=log['updated_at']
             ) for log in result.data
         ]
         
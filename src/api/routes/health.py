@@ -2,6 +2,7 @@
 Health check API route
 """
 
+import time
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
 from database.connection import get_db_pool
@@ -25,15 +26,26 @@ async def health_check(
     
     try:
         # Check database connectivity (even during suspension)
+        acquire_started = time.perf_counter()
         async with db_pool.acquire() as conn:
+            acquire_ms = (time.perf_counter() - acquire_started) * 1000
             await conn.fetchval("SELECT 1")
         
         # Always report healthy, but include suspension status for monitoring
         response = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "database": "connected",
-            "email": "resend_configured"
+            "email": "resend_configured",
+            # Pool saturation signals: in_use near max_size or a slow acquire means requests are queueing
+            "database_pool": {
+                "size": db_pool.get_size(),
+                "idle": db_pool.get_idle_size(),
+                "in_use": db_pool.get_size() - db_pool.get_idle_size(),
+                "min_size": db_pool.get_min_size(),
+                "max_size": db_pool.get_max_size(),
+                "acquire_ms": round(acquire_ms, 2)
+            }
         }
         
         # Add suspension status for monitoring (but don't affect health)
@@ -7,9 +7,12 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from config.settings import PORT, ALLOWED_ORIGINS, OPENAI_API_KEY
 from database.connection import init_database, close_database
+from services.summary_service import summary_service
+from services.email_service import resend_client
 from api.routes import health, documents, cases, emails, webhooks, alerts, agent_conversations, agent_messages, agent_summaries, agent_context, client_communications, error_logs, agent_db, oauth2
 from utils.error_handling import setup_error_handling
 
@@ -25,12 +28,15 @@ async def lifespan(app: FastAPI):
     # Initialize agent gateway LLM client if API key is available
     if OPENAI_API_KEY:
         from agent_gateway.utils.llm_client import init_llm_client
-        init_llm_client(OPENAI_API_KEY)
+        # Share the summary service's OpenAI client so both reuse one keep-alive connection pool
+        init_llm_client(OPENAI_API_KEY, client=summary_service.client)
         logger.info("Agent gateway LLM client initialized")
     else:
         logger.warning("Agent gateway disabled - OPENAI_API_KEY not configured")
     
     yield
+    await summary_service.client.close()
+    await resend_client.aclose()
     await close_database()
 
 # FastAPI app initialization
@@ -42,6 +48,9 @@ app = FastAPI(
 )
 
 
+# Compress larger responses (analysis payloads) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
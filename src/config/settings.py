@@ -3,7 +3,6 @@ Configuration settings for the Legal Communications Backend
 """
 
 import os
-import resend
 import logging
 
 # Configure logging
@@ -18,8 +17,27 @@ FROM_EMAIL = os.getenv("FROM_EMAIL")
 ALERT_FROM_EMAIL = os.getenv("ALERT_FROM_EMAIL", FROM_EMAIL)  # Defaults to FROM_EMAIL if not set
 PORT = int(os.getenv("PORT", 8080))
 RESEND_WEBHOOK_SECRET = os.getenv("RESEND_WEBHOOK_SECRET")
+# Uvicorn worker processes; the kill-switch suspension state is per process, so keep 1 unless it is shared
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
 ADMIN_ALERT_EMAILS = [email.strip() for email in os.getenv("ADMIN_ALERT_EMAILS", "admin@company.com").split(",")]
 
+# Database pool sizing (per worker); asyncpg opens min_size connections eagerly when the pool is created
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 5))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 25))
+# Seconds an idle connection above min_size is kept before being closed
+DB_POOL_MAX_INACTIVE_LIFETIME = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", 300))
+# Per-statement timeout in seconds; a stuck query releases its pooled connection after this
+DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", 60))
+
+# Database session settings
+PG_JIT = os.getenv("PG_JIT", "default")  # "on", "off", or "default" to leave the server setting untouched
+# Reported in pg_stat_activity so this service's sessions and slow queries are attributable
+PG_APPLICATION_NAME = os.getenv("PG_APPLICATION_NAME", "luceron-backend")
+# Set PGBOUNCER=false when DATABASE_URL points straight at Postgres
+PGBOUNCER = os.getenv("PGBOUNCER", "true").lower() == "true"
+# asyncpg prepared statement cache; must stay 0 behind pgbouncer transaction pooling
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 0 if PGBOUNCER else 1024))
+
 # Agent gateway configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
@@ -60,9 +78,6 @@ if not RESEND_API_KEY:
 if not OPENAI_API_KEY:
     logger.warning("OPENAI_API_KEY not set - agent gateway will not be available")
 
-# Configure Resend
-resend.api_key = RESEND_API_KEY
-
 # CORS settings
 ALLOWED_ORIGINS = [
     "https://simple-s3-upload.onrender.com",  # frontend URL
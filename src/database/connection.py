@@ -4,29 +4,68 @@ Database connection and pool management
 
 import asyncpg
 import logging
-from config.settings import DATABASE_URL
+import orjson
+from config.settings import (
+    DATABASE_URL, PG_JIT, PG_APPLICATION_NAME, DB_STATEMENT_CACHE_SIZE, DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE,
+    DB_POOL_MAX_INACTIVE_LIFETIME, DB_COMMAND_TIMEOUT
+)
+from utils.helpers import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
 # Global database pool
 db_pool = None
 
+# JSONB binary wire format is a 1-byte version header followed by the JSON text
+_JSONB_BINARY_VERSION = b"\x01"
+
+def _encode_jsonb(value) -> bytes:
+    """Encode a Python value to JSONB binary format"""
+    return _JSONB_BINARY_VERSION + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+def _decode_jsonb(data: bytes):
+    """Decode JSONB binary format, skipping the version header"""
+    return orjson.loads(data[1:])
+
+async def _init_connection(conn):
+    """Register JSON codecs so JSON/JSONB columns round-trip as Python objects"""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary"
+    )
+    await conn.set_type_codec(
+        "json",
+        encoder=json_dumps,
+        decoder=json_loads,
+        schema="pg_catalog"
+    )
+
 async def init_database():
     """Initialize database connection pool"""
     global db_pool
+    server_settings = {"application_name": PG_APPLICATION_NAME}
+    # Let Postgres decide on JIT unless an operator explicitly opts in/out
+    if PG_JIT != "default":
+        server_settings["jit"] = PG_JIT
     db_pool = await asyncpg.create_pool(
         DATABASE_URL,
-        min_size=2,
-        max_size=10,
-        command_timeout=60,
-        statement_cache_size=0  # Fix for pgbouncer compatibility
+        min_size=DB_POOL_MIN_SIZE,
+        max_size=DB_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_LIFETIME,
+        command_timeout=DB_COMMAND_TIMEOUT,
+        statement_cache_size=DB_STATEMENT_CACHE_SIZE,  # 0 for pgbouncer compatibility
+        server_settings=server_settings,
+        init=_init_connection
     )
     
     # Test connection
     async with db_pool.acquire() as conn:
         await conn.fetchval("SELECT 1")
     
-    logger.info("Database initialized successfully")
+    logger.info(f"Database initialized successfully (pool {db_pool.get_size()}/{DB_POOL_MAX_SIZE} connections open)")
 
 
 async def close_database():
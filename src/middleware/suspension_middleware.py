@@ -5,7 +5,7 @@ Suspension middleware for blocking requests during emergency suspension
 import logging
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from utils.suspension import suspension_manager
 
@@ -47,7 +47,7 @@ class SuspensionMiddleware(BaseHTTPMiddleware):
             
             logger.warning(f"🔴 BLOCKED REQUEST during suspension: {request.method} {path}")
             
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "detail": "Server is currently suspended for emergency maintenance",
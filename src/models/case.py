@@ -4,7 +4,7 @@ Case-related Pydantic models
 
 from typing import List, Optional, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 from uuid import UUID
 from enum import Enum
 from models.enums import CaseStatus
@@ -44,6 +44,18 @@ class CaseCreateRequest(BaseModel):
     client_email: str
     client_phone: Optional[str] = None
 
+class CaseBulkCreateRequest(BaseModel):
+    """Request model for creating several cases at once"""
+    cases: List[CaseCreateRequest] = Field(..., description="Cases to create")
+    
+    @validator('cases')
+    def validate_cases(cls, v):
+        if not v:
+            raise ValueError('cases cannot be empty')
+        if len(v) > 500:  # Same cap as bulk analysis persistence
+            raise ValueError('cases cannot exceed 500 items per request')
+        return v
+
 class CaseUpdateRequest(BaseModel):
     client_name: Optional[str] = None
     client_email: Optional[str] = None
@@ -7,6 +7,7 @@ from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel, Field, validator
 from models.enums import Status
+from utils.helpers import json_loads
 
 class DocumentData(BaseModel):
     document_id: UUID
@@ -130,9 +131,8 @@ class BulkAnalysisRecord(BaseModel):
             raise ValueError('analysis_content cannot be empty')
         # Attempt to validate JSON structure
         try:
-            import json
-            json.loads(v)
-        except json.JSONDecodeError:
+            json_loads(v)
+        except ValueError:
             raise ValueError('analysis_content must be valid JSON')
         return v.strip()
     
@@ -287,9 +287,8 @@ class DocumentAnalysisUpdateRequest(BaseModel):
             if not v or not v.strip():
                 raise ValueError('analysis_content cannot be empty string')
             try:
-                import json
-                json.loads(v)
-            except json.JSONDecodeError:
+                json_loads(v)
+            except ValueError:
                 raise ValueError('analysis_content must be valid JSON')
         return v.strip() if v else v
     
@@ -2,22 +2,19 @@
 Error log Pydantic models
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel
-from enum import Enum
 
-class ErrorSeverity(str, Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+# Literal rather than Enum: validated entirely in pydantic-core, and values
+# round-trip from the database as plain strings
+ErrorSeverity = Literal["low", "medium", "high", "critical"]
 
 class ErrorLogCreate(BaseModel):
     component: str
     error_message: str
-    severity: ErrorSeverity = ErrorSeverity.MEDIUM
+    severity: ErrorSeverity = "medium"
     context: Optional[Dict[str, Any]] = None
     email_sent: bool = False
 
@@ -6,7 +6,7 @@ Prevents cross-environment token reuse through environment-specific signing and
 import jwt
 import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from config.service_permissions import is_valid_agent_role, get_service_permissions
@@ -14,6 +14,12 @@ from config.settings import JWTEnvironmentConfig, ENV
 
 logger = logging.getLogger(__name__)
 
+# Validated-token cache bounds: chatty agents reuse one token for many calls
+JWT_CACHE_TTL_SECONDS = 60
+JWT_CACHE_MAX_SIZE = 10000
+
+REQUIRED_JWT_CLAIMS = ("sub", "environment", "iss", "aud", "exp", "iat")
+
 class AgentJWTService:
     """Environment-isolated service for generating and validating agent JWTs"""
     
@@ -23,6 +29,31 @@ class AgentJWTService:
         self.algorithm = self.jwt_config["allowed_algorithms"][0]  # Use first allowed algorithm
         self.issuer = self.jwt_config["issuer"]
         self.audience = self.jwt_config["audience"]
+        # token -> (validated payload, unix time the cache entry expires)
+        self._validated_tokens: Dict[str, Tuple[Dict[str, Any], float]] = {}
+    
+    def _get_cached_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for a previously validated token, if still fresh"""
+        cached = self._validated_tokens.get(token)
+        if cached is None:
+            return None
+        payload, valid_until = cached
+        if time.time() >= valid_until:
+            del self._validated_tokens[token]
+            return None
+        return payload
+    
+    def _cache_payload(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache a validated payload until min(token exp, TTL)"""
+        now = time.time()
+        if len(self._validated_tokens) >= JWT_CACHE_MAX_SIZE:
+            # Drop expired entries first, then the oldest if still full
+            for cached_token, (_, valid_until) in list(self._validated_tokens.items()):
+                if now >= valid_until:
+                    del self._validated_tokens[cached_token]
+            if len(self._validated_tokens) >= JWT_CACHE_MAX_SIZE:
+                del self._validated_tokens[next(iter(self._validated_tokens))]
+        self._validated_tokens[token] = (payload, min(payload["exp"], now + JWT_CACHE_TTL_SECONDS))
     
     def generate_agent_jwt(self, agent_role: str) -> str:
         """
@@ -72,6 +103,11 @@ class AgentJWTService:
         Raises:
             jwt.InvalidTokenError: If token is invalid, tampered, or from wrong environment
         """
+        # Skip signature verification for tokens validated within the cache TTL
+        cached_payload = self._get_cached_payload(token)
+        if cached_payload is not None:
+            return cached_payload
+        
         try:
             # Hardened JWT validation with strict security controls
             payload = jwt.decode(
@@ -98,8 +134,7 @@ class AgentJWTService:
                 raise jwt.InvalidTokenError(f"Environment mismatch: token='{token_env}', server='{ENV}'")
             
             # Validate required claims are present
-            required_claims = ["sub", "environment", "iss", "aud", "exp", "iat"]
-            for claim in required_claims:
+            for claim in REQUIRED_JWT_CLAIMS:
                 if claim not in payload:
                     raise jwt.InvalidTokenError(f"Missing required claim: {claim}")
             
@@ -116,6 +151,7 @@ class AgentJWTService:
                     raise jwt.InvalidTokenError(f"Agent '{agent_role}' not authorized for environment '{ENV}'")
             
             logger.debug(f"Successfully validated environment-isolated JWT for agent role: {agent_role} in {ENV}")
+            self._cache_payload(token, payload)
             return payload
             
         except jwt.ExpiredSignatureError:
@@ -3,13 +3,27 @@ Agent services - business logic for AI agent operations and context management
 """
 
 import logging
-import json
+import time
+from datetime import datetime
 from typing import Dict, Any, List, Optional
+import asyncpg
 from pydantic import ValidationError
+from agent_gateway.models.dsl import DSL, InsertOperation
 from services.base_service import BaseService, ServiceResult
 
 logger = logging.getLogger(__name__)
 
+# Attempts at allocating the next sequence number before reporting a conflict
+MESSAGE_SEQUENCE_RETRIES = 3
+
+# Confirmed conversation IDs are cached briefly so the existence check made on every
+# message write and history read skips a round trip. Only delete_conversation in this
+# process invalidates an entry: other workers and other delete paths can see a deleted
+# conversation as existing for up to the TTL, so inserts that follow the check map
+# their foreign key violation back to "not found"
+CONVERSATION_EXISTS_CACHE_TTL_SECONDS = 30
+CONVERSATION_EXISTS_CACHE_MAX_SIZE = 10000
+
 class AgentContextService(BaseService):
     """Service for agent context management"""
     
@@ -46,20 +60,9 @@ class AgentContextService(BaseService):
                 error_type="NOT_FOUND"
             )
         
-        # Validate and serialize context_value
-        try:
-            if isinstance(context_value, dict):
-                # Ensure context_value is properly serializable
-                import json
-                json.dumps(context_value)  # Test serialization
-            else:
-                context_value = {"value": str(context_value)}
-        except Exception as e:
-            return ServiceResult(
-                success=False,
-                error=f"Invalid context_value format: {e}",
-                error_type="VALIDATION_ERROR"
-            )
+        # Dicts go straight to the pool's binary JSONB codec; wrap anything else
+        if not isinstance(context_value, dict):
+            context_value = {"value": str(context_value)}
         
         context_data = {
             "case_id": case_id,
@@ -105,6 +108,75 @@ class AgentContextService(BaseService):
                     error_type="INTERNAL_ERROR"
                 )
     
+    async def upsert_context(
+        self,
+        case_id: str,
+        agent_type: str,
+        context_key: str,
+        context_value: Dict[str, Any],
+        expires_at: Optional[datetime] = None
+    ) -> ServiceResult:
+        """
+        Create a context item, or replace the value of the existing one, in a single statement
+        
+        The (case_id, agent_type, context_key) unique constraint resolves the upsert and
+        the case foreign key doubles as the existence check, so no lookups precede it.
+        
+        Args:
+            case_id: UUID of the associated case
+            agent_type: Type of agent
+            context_key: Unique key for this context item
+            context_value: JSON context data
+            expires_at: Optional expiration, only applied when the item is created
+            
+        Returns:
+            ServiceResult with the stored context data
+        """
+        if not isinstance(context_value, dict):
+            context_value = {"value": str(context_value)}
+        
+        logger.info(f"Upserting context for {agent_type} agent - case {case_id}, key: {context_key}")
+        
+        try:
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            row = await db_pool.fetchrow("""
+                INSERT INTO agent_context (case_id, agent_type, context_key, context_value, expires_at)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (case_id, agent_type, context_key)
+                DO UPDATE SET context_value = EXCLUDED.context_value, updated_at = NOW()
+                RETURNING context_id, case_id, agent_type, context_key, context_value,
+                          expires_at, created_at, updated_at
+            """, case_id, agent_type, context_key, context_value, expires_at)
+            
+            return ServiceResult(
+                success=True,
+                data=[self._row_to_dict(row, set())],
+                count=1
+            )
+            
+        except asyncpg.ForeignKeyViolationError:
+            return ServiceResult(
+                success=False,
+                error=f"Case {case_id} not found",
+                error_type="NOT_FOUND"
+            )
+        except asyncpg.DataError as e:
+            # Malformed case ID or unknown agent type
+            return ServiceResult(
+                success=False,
+                error=f"Invalid value: {e}",
+                error_type="INVALID_QUERY"
+            )
+        except Exception as e:
+            logger.error(f"Failed to upsert context for case {case_id}: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="EXECUTION_ERROR"
+            )
+    
     async def get_context_by_id(self, context_id: str) -> ServiceResult:
         """Get context by ID"""
         return await self.get_by_id(context_id)
@@ -133,35 +205,28 @@ class AgentContextService(BaseService):
             from database.connection import get_db_pool
             db_pool = get_db_pool()
             
-            async with db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT context_id, case_id, agent_type, context_key, context_value, 
-                           expires_at, created_at, updated_at
-                    FROM agent_context 
-                    WHERE case_id = $1 AND agent_type = $2 AND context_key = $3
-                    AND (expires_at IS NULL OR expires_at > NOW())
-                """, case_id, agent_type, context_key)
-                
-                if not row:
-                    return ServiceResult(
-                        success=True,
-                        data=[],
-                        count=0
-                    )
-                
-                data = [dict(row)]
-                
-                # Convert datetime objects to ISO strings
-                for row_dict in data:
-                    for key, value in row_dict.items():
-                        if hasattr(value, 'isoformat'):
-                            row_dict[key] = value.isoformat()
-                
+            row = await db_pool.fetchrow("""
+                SELECT context_id, case_id, agent_type, context_key, context_value, 
+                       expires_at, created_at, updated_at
+                FROM agent_context 
+                WHERE case_id = $1 AND agent_type = $2 AND context_key = $3
+                AND (expires_at IS NULL OR expires_at > NOW())
+            """, case_id, agent_type, context_key)
+            
+            if not row:
                 return ServiceResult(
                     success=True,
-                    data=data,
-                    count=1
+                    data=[],
+                    count=0
                 )
+            
+            # Timestamps stay as datetimes; the response models and the JSON
+            # encoder serialize them without an intermediate string round-trip
+            return ServiceResult(
+                success=True,
+                data=[dict(row)],
+                count=1
+            )
                 
         except Exception as e:
             logger.error(f"Failed to get non-expired context by key: {e}")
@@ -187,24 +252,23 @@ class AgentContextService(BaseService):
             from database.connection import get_db_pool
             db_pool = get_db_pool()
             
-            async with db_pool.acquire() as conn:
-                result = await conn.execute(
-                    "DELETE FROM agent_context WHERE context_id = $1",
-                    context_id
-                )
-                
-                if result == "DELETE 0":
-                    return ServiceResult(
-                        success=False,
-                        error="Context not found",
-                        error_type="NOT_FOUND"
-                    )
-                
+            result = await db_pool.execute(
+                "DELETE FROM agent_context WHERE context_id = $1",
+                context_id
+            )
+            
+            if result == "DELETE 0":
                 return ServiceResult(
-                    success=True,
-                    data=[{"context_id": context_id, "deleted": True}],
-                    count=1
+                    success=False,
+                    error="Context not found",
+                    error_type="NOT_FOUND"
                 )
+            
+            return ServiceResult(
+                success=True,
+                data=[{"context_id": context_id, "deleted": True}],
+                count=1
+            )
                 
         except Exception as e:
             logger.error(f"Failed to delete context {context_id}: {e}")
@@ -222,20 +286,19 @@ class AgentContextService(BaseService):
             from database.connection import get_db_pool
             db_pool = get_db_pool()
             
-            async with db_pool.acquire() as conn:
-                result = await conn.execute(
-                    "DELETE FROM agent_context WHERE case_id = $1 AND agent_type = $2",
-                    case_id, agent_type
-                )
-                
-                # Extract the number of deleted rows
-                deleted_count = int(result.split()[-1]) if result.startswith("DELETE") else 0
-                
-                return ServiceResult(
-                    success=True,
-                    data=[{"case_id": case_id, "agent_type": agent_type, "deleted_count": deleted_count}],
-                    count=deleted_count
-                )
+            result = await db_pool.execute(
+                "DELETE FROM agent_context WHERE case_id = $1 AND agent_type = $2",
+                case_id, agent_type
+            )
+            
+            # Extract the number of deleted rows
+            deleted_count = int(result.split()[-1]) if result.startswith("DELETE") else 0
+            
+            return ServiceResult(
+                success=True,
+                data=[{"case_id": case_id, "agent_type": agent_type, "deleted_count": deleted_count}],
+                count=deleted_count
+            )
                 
         except Exception as e:
             logger.error(f"Failed to delete contexts for case {case_id}, agent {agent_type}: {e}")
@@ -253,19 +316,18 @@ class AgentContextService(BaseService):
             from database.connection import get_db_pool
             db_pool = get_db_pool()
             
-            async with db_pool.acquire() as conn:
-                result = await conn.execute(
-                    "DELETE FROM agent_context WHERE expires_at IS NOT NULL AND expires_at <= NOW()"
-                )
-                
-                # Extract the number of deleted rows
-                deleted_count = int(result.split()[-1]) if result.startswith("DELETE") else 0
-                
-                return ServiceResult(
-                    success=True,
-                    data=[{"deleted_count": deleted_count}],
-                    count=deleted_count
-                )
+            result = await db_pool.execute(
+                "DELETE FROM agent_context WHERE expires_at IS NOT NULL AND expires_at <= NOW()"
+            )
+            
+            # Extract the number of deleted rows
+            deleted_count = int(result.split()[-1]) if result.startswith("DELETE") else 0
+            
+            return ServiceResult(
+                success=True,
+                data=[{"deleted_count": deleted_count}],
+                count=deleted_count
+            )
                 
         except Exception as e:
             logger.error(f"Failed to cleanup expired contexts: {e}")
@@ -340,12 +402,6 @@ class AgentContextService(BaseService):
                     rows = await conn.fetch(query, *query_params)
                     data = [dict(row) for row in rows]
                     
-                    # Convert datetime objects to ISO strings
-                    for row in data:
-                        for key, value in row.items():
-                            if hasattr(value, 'isoformat'):
-                                row[key] = value.isoformat()
-                    
                     return ServiceResult(
                         success=True,
                         data=data,
@@ -386,6 +442,8 @@ class AgentConversationsService(BaseService):
     
     def __init__(self, role: str = "api"):
         super().__init__("agent_conversations", role)
+        # conversation_id -> monotonic time the cache entry expires
+        self._known_conversation_ids: Dict[str, float] = {}
     
     async def create_conversation(
         self,
@@ -415,6 +473,37 @@ class AgentConversationsService(BaseService):
         """Get conversation by ID"""
         return await self.get_by_id(conversation_id)
     
+    async def conversation_exists(self, conversation_id: str) -> bool:
+        """Check whether a conversation exists, using a short-lived cache of confirmed IDs"""
+        conversation_id = str(conversation_id)
+        now = time.monotonic()
+        
+        valid_until = self._known_conversation_ids.get(conversation_id)
+        if valid_until is not None and valid_until > now:
+            return True
+        
+        try:
+            exists = bool(await self.get_existing_ids([conversation_id]))
+        except asyncpg.DataError:
+            # Not a valid UUID
+            return False
+        
+        if exists:
+            if len(self._known_conversation_ids) >= CONVERSATION_EXISTS_CACHE_MAX_SIZE:
+                self._known_conversation_ids.clear()
+            self._known_conversation_ids[conversation_id] = now + CONVERSATION_EXISTS_CACHE_TTL_SECONDS
+        else:
+            self._known_conversation_ids.pop(conversation_id, None)
+        
+        return exists
+    
+    async def delete_conversation(self, conversation_id: str) -> ServiceResult:
+        """Delete a conversation and drop it from the existence cache"""
+        result = await self.delete(conversation_id)
+        if result.success:
+            self._known_conversation_ids.pop(str(conversation_id), None)
+        return result
+    
     async def get_conversations_by_agent_type(self, agent_type: str, limit: int = 100) -> ServiceResult:
         """Get conversations for a specific agent type"""
         return await self.get_by_field("agent_type", agent_type, limit)
@@ -432,17 +521,34 @@ class AgentConversationsService(BaseService):
         return await self.update(conversation_id, {"status": status})
     
     async def add_tokens_used(self, conversation_id: str, tokens: int) -> ServiceResult:
-        """Add tokens to the conversation total (requires current value)"""
-        # Note: This is a simplified approach. In production, you might want
-        # to use atomic SQL updates like: UPDATE ... SET total_tokens_used = total_tokens_used + ?
-        current = await self.get_conversation_by_id(conversation_id)
-        if not current.success or not current.data:
-            return ServiceResult(success=False, error="Conversation not found")
-        
-        current_tokens = current.data[0].get("total_tokens_used", 0)
-        new_total = current_tokens + tokens
-        
-        return await self.update(conversation_id, {"total_tokens_used": new_total})
+        """Atomically add tokens to the conversation total in a single statement"""
+        try:
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            # Explicit RETURNING list keeps the statement's result type stable
+            # across schema changes (no "cached plan must not change result type")
+            row = await db_pool.fetchrow("""
+                UPDATE agent_conversations
+                SET total_tokens_used = COALESCE(total_tokens_used, 0) + $2,
+                    updated_at = NOW()
+                WHERE conversation_id = $1
+                RETURNING conversation_id, agent_type, status, total_tokens_used,
+                          created_at, updated_at
+            """, conversation_id, tokens)
+            
+            if not row:
+                return ServiceResult(success=False, error="Conversation not found", error_type="NOT_FOUND")
+            
+            return ServiceResult(success=True, data=[dict(row)], count=1)
+                
+        except Exception as e:
+            logger.error(f"Failed to add tokens to conversation {conversation_id}: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="EXECUTION_ERROR"
+            )
 
 class AgentMessagesService(BaseService):
     """Service for agent message management"""
@@ -479,17 +585,14 @@ class AgentMessagesService(BaseService):
         Returns:
             ServiceResult with created message data
         """
-        # Auto-generate sequence number if not provided
-        if sequence_number is None:
-            sequence_number = await self._get_next_sequence_number(conversation_id)
-        
         message_data = {
             "conversation_id": conversation_id,
             "role": role,
             "content": content,
-            "model_used": model_used,
-            "sequence_number": sequence_number
+            "model_used": model_used
         }
+        if sequence_number is not None:
+            message_data["sequence_number"] = sequence_number
         
         if total_tokens is not None:
             message_data["total_tokens"] = total_tokens
@@ -505,6 +608,10 @@ class AgentMessagesService(BaseService):
         
         logger.info(f"Creating {role} message for conversation {conversation_id}")
         
+        # Auto-generate sequence number if not provided
+        if sequence_number is None:
+            return await self._create_message_with_next_sequence(message_data)
+        
         try:
             result = await self.create(message_data)
             return result
@@ -537,25 +644,98 @@ class AgentMessagesService(BaseService):
                     error_type="INTERNAL_ERROR"
                 )
 
-    async def _get_next_sequence_number(self, conversation_id: str) -> int:
-        """Get next sequence number for message in conversation"""
+    async def _create_message_with_next_sequence(self, message_data: Dict[str, Any]) -> ServiceResult:
+        """
+        Insert a message numbered MAX(sequence_number) + 1 in a single statement
+        
+        The sequence number is computed by the INSERT itself rather than read
+        first, and a concurrent writer taking the same number is retried
+        against the unique_conversation_sequence constraint.
+        """
+        # sequence_number is required by the contract but assigned by the INSERT
+        # below, so validate with a placeholder in its place
+        validation_error = self.validator.validate(
+            DSL(steps=[InsertOperation(
+                resource=self.resource_name,
+                values={**message_data, "sequence_number": 1}
+            )]),
+            self.contracts,
+            self.role
+        )
+        if validation_error:
+            return ServiceResult(
+                success=False,
+                error=validation_error.message,
+                error_type=validation_error.error_type
+            )
+        
         try:
-            # Get all messages for this conversation and find max sequence number
-            result = await self.read(
-                fields=["sequence_number"],
-                filters={"conversation_id": conversation_id},
-                order_by=[{"field": "sequence_number", "dir": "desc"}],
-                limit=1
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            query = f"""
+                INSERT INTO agent_messages (
+                    conversation_id, role, content, model_used, total_tokens,
+                    function_name, function_arguments, function_response,
+                    sequence_number, created_at
+                )
+                SELECT $1::uuid, $2::message_role, $3::jsonb, $4, $5::integer,
+                       $6, $7::jsonb, $8::jsonb,
+                       COALESCE(MAX(sequence_number), 0) + 1, NOW()
+                FROM agent_messages
+                WHERE conversation_id = $1::uuid
+                RETURNING {self._returning_columns(self.resource_name)}
+            """
+            params = (
+                message_data["conversation_id"], message_data["role"], message_data["content"],
+                message_data["model_used"], message_data.get("total_tokens"),
+                message_data.get("function_name"), message_data.get("function_arguments"),
+                message_data.get("function_response")
+            )
+            
+            async with db_pool.acquire() as conn:
+                for attempt in range(MESSAGE_SEQUENCE_RETRIES):
+                    try:
+                        row = await conn.fetchrow(query, *params)
+                        break
+                    except asyncpg.UniqueViolationError:
+                        logger.debug(
+                            "Sequence number taken for conversation %s (attempt %s), retrying",
+                            message_data["conversation_id"], attempt + 1
+                        )
+                else:
+                    return ServiceResult(
+                        success=False,
+                        error="Message sequence conflict",
+                        error_type="DUPLICATE_ERROR"
+                    )
+            
+            return ServiceResult(
+                success=True,
+                data=[self._row_to_dict(row, set())],
+                count=1
+            )
+            
+        except asyncpg.ForeignKeyViolationError:
+            return ServiceResult(
+                success=False,
+                error="Referenced conversation not found",
+                error_type="FOREIGN_KEY_ERROR"
+            )
+        except asyncpg.DataError as e:
+            return ServiceResult(
+                success=False,
+                error=f"Invalid value: {e}",
+                error_type="INVALID_QUERY"
             )
-            if result.success and result.data and len(result.data) > 0:
-                max_sequence = result.data[0].get("sequence_number", 0)
-                return (max_sequence or 0) + 1
-            return 1
         except Exception as e:
-            # Log error and default to 1
-            logger.warning(f"Failed to get sequence number for conversation {conversation_id}: {e}")
-            return 1
-    
+            logger.error(f"Unexpected error in {self.__class__.__name__}.create_message: {e}", exc_info=True)
+            return ServiceResult(
+                success=False, 
+                error="Internal server error", 
+                error_type="INTERNAL_ERROR"
+            )
+
     async def get_message_by_id(self, message_id: str) -> ServiceResult:
         """Get message by ID"""
         return await self.get_by_id(message_id)
@@ -588,24 +768,23 @@ class AgentMessagesService(BaseService):
             from database.connection import get_db_pool
             db_pool = get_db_pool()
             
-            async with db_pool.acquire() as conn:
-                result = await conn.execute(
-                    "DELETE FROM agent_messages WHERE message_id = $1",
-                    message_id
-                )
-                
-                if result == "DELETE 0":
-                    return ServiceResult(
-                        success=False,
-                        error="Message not found",
-                        error_type="NOT_FOUND"
-                    )
-                
+            result = await db_pool.execute(
+                "DELETE FROM agent_messages WHERE message_id = $1",
+                message_id
+            )
+            
+            if result == "DELETE 0":
                 return ServiceResult(
-                    success=True,
-                    data=[{"message_id": message_id, "deleted": True}],
-                    count=1
+                    success=False,
+                    error="Message not found",
+                    error_type="NOT_FOUND"
                 )
+            
+            return ServiceResult(
+                success=True,
+                data=[{"message_id": message_id, "deleted": True}],
+                count=1
+            )
                 
         except Exception as e:
             logger.error(f"Failed to delete message {message_id}: {e}")
@@ -649,9 +828,8 @@ class AgentMessagesService(BaseService):
         # First check if conversation exists using conversations service
         from services.agent_services import get_agent_conversations_service
         conv_service = get_agent_conversations_service()
-        conv_result = await conv_service.get_conversation_by_id(conversation_id)
         
-        if not conv_result.success or not conv_result.data:
+        if not await conv_service.conversation_exists(conversation_id):
             return ServiceResult(
                 success=False,
                 error="Conversation not found",
@@ -3,6 +3,7 @@ Base service layer for unified database operations using Agent Gateway
 """
 
 import logging
+import re
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 
@@ -10,10 +11,28 @@ from agent_gateway.contracts.registry import get_all_contracts
 from agent_gateway.validator import get_validator, ValidationError
 from agent_gateway.models.dsl import DSL, ReadOperation, UpdateOperation, InsertOperation, WhereClause, OrderByClause
 from database.connection import get_db_pool
+from utils.helpers import json_dumps, json_loads
 import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# Field names treated as dates/timestamps: *_at, *date*, *time* (covers created_at, expires_at, timestamp, ...)
+_DATE_FIELD_RE = re.compile(r'_at|date|time', re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Resource name -> table name, shared by every query builder
+_RESOURCE_TABLES = {
+    "cases": "cases",
+    "client_communications": "client_communications",
+    "documents": "documents",
+    "document_analysis": "document_analysis",
+    "error_logs": "error_logs",
+    "agent_context": "agent_context",
+    "agent_conversations": "agent_conversations",
+    "agent_messages": "agent_messages",
+    "agent_summaries": "agent_summaries"
+}
+
 @dataclass
 class ServiceResult:
     """Result from service operation"""
@@ -24,6 +43,12 @@ class ServiceResult:
     error_type: Optional[str] = None
     page_info: Optional[Dict[str, Any]] = None
 
+class InvalidValueError(Exception):
+    """A value was rejected by a schema constraint or type check (client error)"""
+
+class ReferencedRecordNotFoundError(Exception):
+    """A foreign key pointed at a row that does not exist (or was just deleted)"""
+
 class BaseService:
     """Base service that wraps Agent Gateway components for unified data access"""
     
@@ -75,6 +100,19 @@ class BaseService:
                 count=result["count"]
             )
             
+        except InvalidValueError as e:
+            # Values rejected by schema constraints are client errors
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="INVALID_QUERY"
+            )
+        except ReferencedRecordNotFoundError:
+            return ServiceResult(
+                success=False,
+                error="Referenced record not found",
+                error_type="FOREIGN_KEY_ERROR"
+            )
         except Exception as e:
             # Enhanced error logging and handling
             logger.error(f"Create operation failed for {self.resource_name}: {e}", exc_info=True)
@@ -191,6 +229,13 @@ class BaseService:
                 page_info=result.get("page_info")
             )
             
+        except InvalidValueError as e:
+            # Values rejected by schema constraints are client errors
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="INVALID_QUERY"
+            )
         except Exception as e:
             logger.error(f"Read operation failed for {self.resource_name}: {e}")
             return ServiceResult(
@@ -254,12 +299,19 @@ class BaseService:
                 count=result["count"]
             )
             
+        except InvalidValueError as e:
+            # Values rejected by schema constraints are client errors
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="INVALID_QUERY"
+            )
         except Exception as e:
             # Enhanced error logging and handling for updates
             logger.error(f"Update operation failed for {self.resource_name}: {e}", exc_info=True)
             
             error_msg = str(e).lower()
-            if "not found" in error_msg or "no rows affected" in error_msg:
+            if "not found" in error_msg or "no record found" in error_msg or "no rows affected" in error_msg:
                 return ServiceResult(
                     success=False,
                     error=f"Record with id {record_id} not found",
@@ -301,6 +353,33 @@ class BaseService:
             limit=1
         )
     
+    async def get_existing_ids(self, record_ids: List[Any]) -> set:
+        """
+        Check which primary keys exist with a single query instead of one lookup per ID
+        
+        Args:
+            record_ids: Primary key values to check
+            
+        Returns:
+            Set of the IDs (as strings) that exist
+        """
+        if not record_ids:
+            return set()
+        
+        db_pool = get_db_pool()
+        if not db_pool:
+            raise RuntimeError("Database pool not initialized")
+        
+        table_name = self._get_table_name(self.resource_name)
+        id_field = self._get_id_field(self.resource_name)
+        
+        rows = await db_pool.fetch(
+            f"SELECT {id_field} FROM {table_name} WHERE {id_field} = ANY($1::uuid[])",
+            [str(record_id) for record_id in record_ids]
+        )
+        
+        return {str(row[id_field]) for row in rows}
+    
     async def get_by_field(self, field_name: str, value: Any, limit: int = 100) -> ServiceResult:
         """
         Get records by specific field value
@@ -383,6 +462,16 @@ class BaseService:
         """Get list of readable field names for this resource"""
         return [f.name for f in self.contract.fields if f.readable]
     
+    def _returning_columns(self, resource: str) -> str:
+        """
+        Readable columns of a resource, for RETURNING clauses
+        
+        Every contract currently exposes all of its table's columns, so this
+        returns what RETURNING * would; naming them keeps the statement's
+        result shape fixed if a column is added to the table later.
+        """
+        return ', '.join(f.name for f in self.contracts[resource].fields if f.readable)
+    
     def get_writable_fields(self) -> List[str]:
         """Get list of writable field names for this resource"""
         return [f.name for f in self.contract.fields if f.writable]
@@ -397,6 +486,22 @@ class BaseService:
     
     # Direct SQL execution methods (avoid circular dependency with executor)
     
+    @staticmethod
+    def _row_to_dict(row: asyncpg.Record, json_text_fields: set) -> Dict[str, Any]:
+        """Convert a record to a response dict in one pass (ISO timestamps, parsed JSON text)"""
+        row_dict = {}
+        for key, value in row.items():
+            if hasattr(value, 'isoformat'):
+                value = value.isoformat()
+            elif key in json_text_fields and isinstance(value, str):
+                try:
+                    value = json_loads(value)
+                except (ValueError, TypeError):
+                    # If it's not valid JSON, keep it as string
+                    pass
+            row_dict[key] = value
+        return row_dict
+    
     async def _execute_read_sql(self, dsl: DSL) -> Dict[str, Any]:
         """Execute READ DSL directly via SQL"""
         operation = dsl.get_primary_operation()
@@ -405,50 +510,38 @@ class BaseService:
         if not db_pool:
             raise RuntimeError("Database pool not initialized")
         
-        async with db_pool.acquire() as conn:
-            query, params = self._build_read_query(operation)
-            
-            logger.info(f"Executing READ query: {query}")
-            logger.info(f"Parameters: {params}")
-            
-            try:
-                rows = await conn.fetch(query, *params)
-                data = [dict(row) for row in rows]
-                
-                # Convert datetime objects to ISO strings and deserialize JSONB fields
-                table_name = self._get_table_name(operation.resource)
-                jsonb_fields = self._get_jsonb_fields(table_name)
-                
-                for row in data:
-                    for key, value in row.items():
-                        if hasattr(value, 'isoformat'):
-                            row[key] = value.isoformat()
-                        elif key in jsonb_fields and isinstance(value, str):
-                            # Deserialize JSONB fields back to dictionaries
-                            import json
-                            try:
-                                row[key] = json.loads(value)
-                            except (json.JSONDecodeError, TypeError):
-                                # If it's not valid JSON, keep it as string
-                                pass
-                
-                # Build pagination info
-                page_info = None
-                if operation.offset > 0 or operation.limit < 1000:  # reasonable default
-                    page_info = {
-                        "limit": operation.limit,
-                        "offset": operation.offset
-                    }
-                
-                return {
-                    "data": data,
-                    "count": len(data),
-                    "page_info": page_info
-                }
-                
-            except asyncpg.PostgresError as e:
-                logger.error(f"Database error: {e}")
-                raise RuntimeError(f"Database query failed: {str(e)}")
+        query, params = self._build_read_query(operation)
+        
+        logger.debug("Executing READ query: %s", query)
+        logger.debug("Parameters: %s", params)
+        
+        # Pool-level fetch holds a connection only for the query itself
+        try:
+            rows = await db_pool.fetch(query, *params)
+        except asyncpg.DataError as e:
+            logger.warning(f"Filter value rejected by database: {e}")
+            raise InvalidValueError(f"Invalid value: {e}")
+        except asyncpg.PostgresError as e:
+            logger.error(f"Database error: {e}")
+            raise RuntimeError(f"Database query failed: {str(e)}")
+        
+        # Convert datetime objects to ISO strings and deserialize JSON text fields
+        json_text_fields = self._get_json_text_fields(self._get_table_name(operation.resource))
+        data = [self._row_to_dict(row, json_text_fields) for row in rows]
+        
+        # Build pagination info
+        page_info = None
+        if operation.offset > 0 or operation.limit < 1000:  # reasonable default
+            page_info = {
+                "limit": operation.limit,
+                "offset": operation.offset
+            }
+        
+        return {
+            "data": data,
+            "count": len(data),
+            "page_info": page_info
+        }
     
     async def _execute_insert_sql(self, dsl: DSL) -> Dict[str, Any]:
         """Execute INSERT DSL directly via SQL"""
@@ -458,76 +551,44 @@ class BaseService:
         if not db_pool:
             raise RuntimeError("Database pool not initialized")
         
-        async with db_pool.acquire() as conn:
-            async with conn.transaction():
-                query, params = self._build_insert_query(operation)
-                
-                logger.info(f"Executing INSERT: {query}")
-                logger.info(f"Parameters: {params}")
-                
-                try:
-                    row = await conn.fetchrow(query, *params)
-                    
-                    # CRITICAL: Verify row was actually inserted
-                    if not row:
-                        raise RuntimeError("Insert operation failed - no data returned")
-                    
-                    data = [dict(row)]
-                    
-                    # Convert datetime objects to ISO strings and deserialize JSONB fields
-                    table_name = self._get_table_name(operation.resource)
-                    jsonb_fields = self._get_jsonb_fields(table_name)
-                    
-                    for row_dict in data:
-                        for key, value in row_dict.items():
-                            if hasattr(value, 'isoformat'):
-                                row_dict[key] = value.isoformat()
-                            elif key in jsonb_fields and isinstance(value, str):
-                                # Deserialize JSONB fields back to dictionaries
-                                import json
-                                try:
-                                    row_dict[key] = json.loads(value)
-                                except (json.JSONDecodeError, TypeError):
-                                    # If it's not valid JSON, keep it as string
-                                    pass
-                    
-                    # Double-check: verify record exists in database
-                    table_name = self._get_table_name(operation.resource)
-                    id_field = self._get_id_field(operation.resource)
-                    record_id = row[id_field]
-                    
-                    verify_query = f"SELECT 1 FROM {table_name} WHERE {id_field} = $1"
-                    verification = await conn.fetchrow(verify_query, record_id)
-                    
-                    if not verification:
-                        raise RuntimeError("Insert operation failed - record not found after insertion")
-                    
-                    return {
-                        "data": data,
-                        "count": 1
-                    }
-                    
-                except asyncpg.UniqueViolationError as e:
-                    logger.warning(f"Unique constraint violation: {e}")
-                    raise RuntimeError("CONFLICT: Unique constraint violation")
-                except asyncpg.PostgresError as e:
-                    logger.error(f"Database error during INSERT: {e}")
-                    raise RuntimeError(f"Database INSERT failed: {str(e)}")
+        query, params = self._build_insert_query(operation)
+        
+        logger.debug("Executing INSERT: %s", query)
+        logger.debug("Parameters: %s", params)
+        
+        # A single INSERT ... RETURNING is atomic on its own; the returned row is
+        # proof of insertion, so no explicit transaction or read-back is needed
+        try:
+            row = await db_pool.fetchrow(query, *params)
+        except asyncpg.UniqueViolationError as e:
+            logger.warning(f"Unique constraint violation: {e}")
+            raise RuntimeError("CONFLICT: Unique constraint violation")
+        except (asyncpg.CheckViolationError, asyncpg.DataError) as e:
+            # Status/enum/format validation is enforced by the schema
+            logger.warning(f"Value rejected by database during INSERT: {e}")
+            raise InvalidValueError(f"Invalid value: {e}")
+        except asyncpg.ForeignKeyViolationError as e:
+            logger.warning(f"Referenced record missing during INSERT: {e}")
+            raise ReferencedRecordNotFoundError(f"Referenced record not found: {e}")
+        except asyncpg.PostgresError as e:
+            logger.error(f"Database error during INSERT: {e}")
+            raise RuntimeError(f"Database INSERT failed: {str(e)}")
+        
+        if not row:
+            raise RuntimeError("Insert operation failed - no data returned")
+        
+        # Convert datetime objects to ISO strings and deserialize JSON text fields
+        json_text_fields = self._get_json_text_fields(self._get_table_name(operation.resource))
+        data = [self._row_to_dict(row, json_text_fields)]
+        
+        return {
+            "data": data,
+            "count": 1
+        }
     
     def _get_table_name(self, resource: str) -> str:
         """Get table name for resource"""
-        resource_tables = {
-            "cases": "cases",
-            "client_communications": "client_communications", 
-            "documents": "documents",
-            "document_analysis": "document_analysis",
-            "error_logs": "error_logs",
-            "agent_context": "agent_context",
-            "agent_conversations": "agent_conversations",
-            "agent_messages": "agent_messages",
-            "agent_summaries": "agent_summaries"
-        }
-        return resource_tables.get(resource, resource)
+        return _RESOURCE_TABLES.get(resource, resource)
     
     def _get_id_field(self, resource: str) -> str:
         """Get ID field name for resource"""
@@ -544,15 +605,16 @@ class BaseService:
         }
         return id_fields.get(resource, "id")
     
-    def _get_jsonb_fields(self, table_name: str) -> set:
-        """Get JSONB field names for table that need JSON serialization"""
-        jsonb_fields_map = {
-            "agent_messages": {"content", "function_arguments", "function_response"},
-            "agent_context": {"context_value"},
+    def _get_json_text_fields(self, table_name: str) -> set:
+        """Get TEXT field names for table that store serialized JSON.
+
+        JSONB columns are encoded/decoded by the codec registered on the
+        connection pool and must not be serialized here.
+        """
+        json_text_fields_map = {
             "document_analysis": {"analysis_content"},
-            "error_logs": {"context"},
         }
-        return jsonb_fields_map.get(table_name, set())
+        return json_text_fields_map.get(table_name, set())
     
     async def _execute_update_sql(self, dsl: DSL) -> Dict[str, Any]:
         """Execute UPDATE DSL directly via SQL"""
@@ -562,49 +624,37 @@ class BaseService:
         if not db_pool:
             raise RuntimeError("Database pool not initialized")
         
-        async with db_pool.acquire() as conn:
-            async with conn.transaction():
-                query, params = self._build_update_query(operation)
-                
-                logger.info(f"Executing UPDATE: {query}")
-                logger.info(f"Parameters: {params}")
-                
-                try:
-                    row = await conn.fetchrow(query, *params)
-                    
-                    if not row:
-                        raise RuntimeError(f"No record found with specified ID for update")
-                    
-                    data = [dict(row)]
-                    
-                    # Convert datetime objects to ISO strings and deserialize JSONB fields
-                    table_name = self._get_table_name(operation.resource)
-                    jsonb_fields = self._get_jsonb_fields(table_name)
-                    
-                    for row_dict in data:
-                        for key, value in row_dict.items():
-                            if hasattr(value, 'isoformat'):
-                                row_dict[key] = value.isoformat()
-                            elif key in jsonb_fields and isinstance(value, str):
-                                # Deserialize JSONB fields back to dictionaries
-                                import json
-                                try:
-                                    row_dict[key] = json.loads(value)
-                                except (json.JSONDecodeError, TypeError):
-                                    # If it's not valid JSON, keep it as string
-                                    pass
-                    
-                    return {
-                        "data": data,
-                        "count": 1
-                    }
-                    
-                except asyncpg.UniqueViolationError as e:
-                    logger.warning(f"Unique constraint violation: {e}")
-                    raise RuntimeError("CONFLICT: Unique constraint violation")
-                except asyncpg.PostgresError as e:
-                    logger.error(f"Database error during UPDATE: {e}")
-                    raise RuntimeError(f"Database UPDATE failed: {str(e)}")
+        query, params = self._build_update_query(operation)
+        
+        logger.debug("Executing UPDATE: %s", query)
+        logger.debug("Parameters: %s", params)
+        
+        # A single UPDATE ... RETURNING is atomic on its own; an explicit
+        # transaction would only add BEGIN/COMMIT round-trips
+        try:
+            row = await db_pool.fetchrow(query, *params)
+        except asyncpg.UniqueViolationError as e:
+            logger.warning(f"Unique constraint violation: {e}")
+            raise RuntimeError("CONFLICT: Unique constraint violation")
+        except (asyncpg.CheckViolationError, asyncpg.DataError) as e:
+            # Status/enum/format validation is enforced by the schema
+            logger.warning(f"Value rejected by database during UPDATE: {e}")
+            raise InvalidValueError(f"Invalid value: {e}")
+        except asyncpg.PostgresError as e:
+            logger.error(f"Database error during UPDATE: {e}")
+            raise RuntimeError(f"Database UPDATE failed: {str(e)}")
+        
+        if not row:
+            raise RuntimeError(f"No record found with specified ID for update")
+        
+        # Convert datetime objects to ISO strings and deserialize JSON text fields
+        json_text_fields = self._get_json_text_fields(self._get_table_name(operation.resource))
+        data = [self._row_to_dict(row, json_text_fields)]
+        
+        return {
+            "data": data,
+            "count": 1
+        }
     
     async def _execute_delete_sql(self, record_id: str, pk_field: str) -> Dict[str, Any]:
         """Execute DELETE operation directly via SQL"""
@@ -613,66 +663,38 @@ class BaseService:
         if not db_pool:
             raise RuntimeError("Database pool not initialized")
         
-        # Resource table mapping
-        resource_tables = {
-            "cases": "cases",
-            "client_communications": "client_communications", 
-            "documents": "documents",
-            "document_analysis": "document_analysis",
-            "error_logs": "error_logs",
-            "agent_context": "agent_context",
-            "agent_conversations": "agent_conversations",
-            "agent_messages": "agent_messages",
-            "agent_summaries": "agent_summaries"
-        }
+        table_name = _RESOURCE_TABLES[self.resource_name]
         
-        table_name = resource_tables[self.resource_name]
+        query = f"DELETE FROM {table_name} WHERE {pk_field} = $1"
         
-        async with db_pool.acquire() as conn:
-            async with conn.transaction():
-                query = f"DELETE FROM {table_name} WHERE {pk_field} = $1"
-                
-                logger.info(f"Executing DELETE: {query}")
-                logger.info(f"Parameters: [{record_id}]")
-                
-                try:
-                    result = await conn.execute(query, record_id)
-                    
-                    # Parse the result to get number of deleted rows
-                    # asyncpg returns "DELETE N" where N is the number of rows
-                    deleted_count = int(result.split()[-1]) if result else 0
-                    
-                    if deleted_count == 0:
-                        raise RuntimeError(f"No record found with ID: {record_id}")
-                    
-                    return {
-                        "count": deleted_count
-                    }
-                    
-                except asyncpg.ForeignKeyViolationError as e:
-                    logger.warning(f"Foreign key constraint violation: {e}")
-                    raise RuntimeError("CONFLICT: Cannot delete record due to foreign key constraints")
-                except asyncpg.PostgresError as e:
-                    logger.error(f"Database error during DELETE: {e}")
-                    raise RuntimeError(f"Database DELETE failed: {str(e)}")
+        logger.debug("Executing DELETE: %s", query)
+        logger.debug("Parameters: [%s]", record_id)
+        
+        try:
+            result = await db_pool.execute(query, record_id)
+            
+            # Parse the result to get number of deleted rows
+            # asyncpg returns "DELETE N" where N is the number of rows
+            deleted_count = int(result.split()[-1]) if result else 0
+            
+            if deleted_count == 0:
+                raise RuntimeError(f"No record found with ID: {record_id}")
+            
+            return {
+                "count": deleted_count
+            }
+            
+        except asyncpg.ForeignKeyViolationError as e:
+            logger.warning(f"Foreign key constraint violation: {e}")
+            raise RuntimeError("CONFLICT: Cannot delete record due to foreign key constraints")
+        except asyncpg.PostgresError as e:
+            logger.error(f"Database error during DELETE: {e}")
+            raise RuntimeError(f"Database DELETE failed: {str(e)}")
     
     def _build_read_query(self, operation: ReadOperation) -> tuple[str, List[Any]]:
         """Build SQL query from READ operation DSL"""
         
-        # Resource table mapping
-        resource_tables = {
-            "cases": "cases",
-            "client_communications": "client_communications", 
-            "documents": "documents",
-            "document_analysis": "document_analysis",
-            "error_logs": "error_logs",
-            "agent_context": "agent_context",
-            "agent_conversations": "agent_conversations",
-            "agent_messages": "agent_messages",
-            "agent_summaries": "agent_summaries"
-        }
-        
-        table_name = resource_tables[operation.resource]
+        table_name = _RESOURCE_TABLES[operation.resource]
         params = []
         param_counter = 1
         
@@ -716,20 +738,7 @@ class BaseService:
     def _build_insert_query(self, operation: InsertOperation) -> tuple[str, List[Any]]:
         """Build SQL INSERT query from DSL"""
         
-        # Resource table mapping
-        resource_tables = {
-            "cases": "cases",
-            "client_communications": "client_communications", 
-            "documents": "documents",
-            "document_analysis": "document_analysis",
-            "error_logs": "error_logs",
-            "agent_context": "agent_context",
-            "agent_conversations": "agent_conversations",
-            "agent_messages": "agent_messages",
-            "agent_summaries": "agent_summaries"
-        }
-        
-        table_name = resource_tables[operation.resource]
+        table_name = _RESOURCE_TABLES[operation.resource]
         params = []
         param_counter = 1
         
@@ -737,16 +746,15 @@ class BaseService:
         field_names = list(operation.values.keys())
         field_placeholders = []
         
-        # Define JSONB fields that need JSON serialization
-        jsonb_fields = self._get_jsonb_fields(table_name)
+        # Define JSON text fields that need JSON serialization
+        json_text_fields = self._get_json_text_fields(table_name)
         
         for field_name, value in operation.values.items():
             field_placeholders.append(f"${param_counter}")
             
-            # Handle JSONB fields - serialize dictionaries to JSON strings
-            if field_name in jsonb_fields and isinstance(value, dict):
-                import json
-                params.append(json.dumps(value))
+            # Handle JSON text fields - serialize dictionaries to JSON strings
+            if field_name in json_text_fields and isinstance(value, dict):
+                params.append(json_dumps(value))
             else:
                 params.append(value)
             param_counter += 1
@@ -759,7 +767,7 @@ class BaseService:
         query = f"""
             INSERT INTO {table_name} ({', '.join(field_names)})
             VALUES ({', '.join(field_placeholders)})
-            RETURNING *
+            RETURNING {self._returning_columns(operation.resource)}
         """
         
         return query, params
@@ -767,34 +775,20 @@ class BaseService:
     def _build_update_query(self, operation: UpdateOperation) -> tuple[str, List[Any]]:
         """Build SQL UPDATE query from DSL"""
         
-        # Resource table mapping
-        resource_tables = {
-            "cases": "cases",
-            "client_communications": "client_communications", 
-            "documents": "documents",
-            "document_analysis": "document_analysis",
-            "error_logs": "error_logs",
-            "agent_context": "agent_context",
-            "agent_conversations": "agent_conversations",
-            "agent_messages": "agent_messages",
-            "agent_summaries": "agent_summaries"
-        }
-        
-        table_name = resource_tables[operation.resource]
+        table_name = _RESOURCE_TABLES[operation.resource]
         params = []
         param_counter = 1
         
         # SET clause
         set_parts = []
-        jsonb_fields = self._get_jsonb_fields(table_name)
+        json_text_fields = self._get_json_text_fields(table_name)
         
         for field_name, value in operation.update.items():
             set_parts.append(f"{field_name} = ${param_counter}")
             
-            # Handle JSONB fields - serialize dictionaries to JSON strings
-            if field_name in jsonb_fields and isinstance(value, dict):
-                import json
-                params.append(json.dumps(value))
+            # Handle JSON text fields - serialize dictionaries to JSON strings
+            if field_name in json_text_fields and isinstance(value, dict):
+                params.append(json_dumps(value))
             else:
                 params.append(value)
             param_counter += 1
@@ -812,8 +806,8 @@ class BaseService:
         
         query += f" WHERE {' AND '.join(where_parts)}"
         
-        # RETURNING clause to get post-image
-        query += " RETURNING *"
+        # RETURNING clause to get post-image (contract columns, like READ)
+        query += f" RETURNING {self._returning_columns(operation.resource)}"
         
         return query, params
     
@@ -828,9 +822,9 @@ class BaseService:
         
         # Convert date strings to datetime objects for date/timestamp fields
         if isinstance(value, str) and self._is_date_field(field):
-            logger.info(f"Converting date field '{field}' with value '{value}'")
+            logger.debug("Converting date field '%s' with value '%s'", field, value)
             converted_value = self._parse_date_string(value)
-            logger.info(f"Converted '{value}' to {converted_value} (type: {type(converted_value)})")
+            logger.debug("Converted '%s' to %s (type: %s)", value, converted_value, type(converted_value))
             value = converted_value
         
         if op == "=":
@@ -879,19 +873,11 @@ class BaseService:
     
     def _is_date_field(self, field_name: str) -> bool:
         """Check if a field is a date/timestamp field that needs conversion"""
-        # Common date field patterns
-        date_field_patterns = [
-            'created_at', 'updated_at', 'date', 'timestamp', 'time',
-            '_at', '_date', '_time', 'expires_at', 'opened_at'
-        ]
-        
-        field_lower = field_name.lower()
-        
-        # Check if field name matches common patterns
-        for pattern in date_field_patterns:
-            if pattern in field_lower:
-                logger.info(f"Field '{field_name}' identified as date field (matches pattern '{pattern}')")
-                return True
+        # Check if field name matches common patterns in a single scan
+        match = _DATE_FIELD_RE.search(field_name)
+        if match:
+            logger.debug("Field '%s' identified as date field (matches pattern '%s')", field_name, match.group(0))
+            return True
         
         # Check field type from contract if available
         field_def = self.contract.get_field(field_name)
@@ -904,14 +890,13 @@ class BaseService:
     def _parse_date_string(self, date_string: str):
         """Convert date string to appropriate datetime object for PostgreSQL"""
         from datetime import datetime, date
-        import re
         
         try:
             # Handle various date formats
             date_string = date_string.strip()
             
             # ISO date format: YYYY-MM-DD
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', date_string):
+            if _ISO_DATE_RE.match(date_string):
                 return datetime.strptime(date_string, '%Y-%m-%d').date()
             
             # ISO datetime format: YYYY-MM-DDTHH:MM:SS or YYYY-MM-DD HH:MM:SS
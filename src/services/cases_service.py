@@ -2,17 +2,51 @@
 Cases service - business logic for case management
 """
 
+import asyncio
 import logging
+import time
+import asyncpg
 from typing import Dict, Any, List, Optional
 from services.base_service import BaseService, ServiceResult
 
 logger = logging.getLogger(__name__)
 
+# Confirmed case IDs are cached briefly so existence checks on hot write paths
+# (document uploads, analysis stores) skip a round trip. Only delete_case in this
+# process invalidates an entry: other workers and other delete paths can see a deleted
+# case as existing for up to the TTL, so inserts that follow the check map their
+# foreign key violation back to "not found"
+CASE_EXISTS_CACHE_TTL_SECONDS = 30
+CASE_EXISTS_CACHE_MAX_SIZE = 10000
+
+# Open cases with no communication in the last $1 days, walked oldest first with a
+# keyset on (created_at, case_id) starting after case $3, at most $2 rows
+_PENDING_REMINDER_CASES_SQL = """
+    SELECT c.case_id, c.client_email, c.client_name, c.client_phone, c.status,
+           c.created_at, lc.last_communication_date
+    FROM cases c
+    CROSS JOIN LATERAL (
+        SELECT MAX(cc.created_at) AS last_communication_date
+        FROM client_communications cc
+        WHERE cc.case_id = c.case_id
+    ) lc
+    WHERE c.status = 'OPEN'
+      AND ($3::uuid IS NULL OR (c.created_at, c.case_id) > (
+          SELECT created_at, case_id FROM cases WHERE case_id = $3::uuid
+      ))
+      AND (lc.last_communication_date IS NULL
+           OR lc.last_communication_date < NOW() - make_interval(days => $1))
+    ORDER BY c.created_at ASC, c.case_id ASC
+    LIMIT $2
+"""
+
 class CasesService(BaseService):
     """Service for case management operations"""
     
     def __init__(self, role: str = "api"):
         super().__init__("cases", role)
+        # case_id -> monotonic time the cache entry expires
+        self._known_case_ids: Dict[str, float] = {}
     
     async def create_case(
         self,
@@ -45,6 +79,60 @@ class CasesService(BaseService):
         logger.info(f"Creating new case for client: {client_email}")
         return await self.create(case_data)
     
+    async def bulk_create_cases(self, cases: List[Dict[str, Any]], status: str = "OPEN") -> ServiceResult:
+        """
+        Create multiple cases with a single set-based INSERT
+        
+        The client columns are passed as parallel arrays and expanded with
+        unnest, so the whole batch is one round trip and one atomic statement.
+        
+        Args:
+            cases: List of dicts with client_name, client_email and optional client_phone
+            status: Initial status for every created case (default: OPEN)
+        
+        Returns:
+            ServiceResult with the created cases; on failure no case is created
+        """
+        if not cases:
+            return ServiceResult(success=True, data=[], count=0)
+        
+        logger.info(f"Creating {len(cases)} cases in bulk")
+        
+        try:
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+        
+            rows = await db_pool.fetch("""
+                INSERT INTO cases (client_name, client_email, client_phone, status)
+                SELECT client_name, client_email, client_phone, $4::case_status
+                FROM unnest($1::text[], $2::text[], $3::text[])
+                    AS new_cases(client_name, client_email, client_phone)
+                RETURNING case_id, client_name, client_email, client_phone, status, created_at
+            """,
+                [case['client_name'] for case in cases],
+                [case['client_email'] for case in cases],
+                [case.get('client_phone') for case in cases],
+                status
+            )
+        
+            data = [self._row_to_dict(row, set()) for row in rows]
+            return ServiceResult(success=True, data=data, count=len(data))
+        
+        except asyncpg.DataError as e:
+            logger.warning(f"Invalid bulk case data: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="INVALID_QUERY"
+            )
+        except Exception as e:
+            logger.error(f"Failed to bulk create cases: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="EXECUTION_ERROR"
+            )
+    
     async def get_case_by_id(self, case_id: str) -> ServiceResult:
         """
         Get a case by its ID
@@ -57,6 +145,183 @@ class CasesService(BaseService):
         """
         return await self.get_by_id(case_id)
     
+    async def get_case_with_last_communication(self, case_id: str) -> ServiceResult:
+        """
+        Get a case and its most recent communication date in a single query
+        
+        Args:
+            case_id: UUID of the case
+            
+        Returns:
+            ServiceResult with the case data plus last_communication_date
+        """
+        try:
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            row = await db_pool.fetchrow("""
+                SELECT c.case_id, c.client_name, c.client_email, c.client_phone,
+                       c.status, c.created_at,
+                       (SELECT MAX(cc.created_at) FROM client_communications cc
+                        WHERE cc.case_id = c.case_id) AS last_communication_date
+                FROM cases c
+                WHERE c.case_id = $1
+            """, case_id)
+            
+            if not row:
+                return ServiceResult(success=True, data=[], count=0)
+            
+            return ServiceResult(
+                success=True,
+                data=[self._row_to_dict(row, set())],
+                count=1
+            )
+            
+        except asyncpg.DataError as e:
+            # Malformed case ID
+            return ServiceResult(
+                success=False,
+                error=f"Invalid value: {e}",
+                error_type="INVALID_QUERY"
+            )
+        except Exception as e:
+            logger.error(f"Failed to get case {case_id} with last communication: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="EXECUTION_ERROR"
+            )
+    
+    async def get_case_communications_json(self, case_id: str, limit: int = 100) -> ServiceResult:
+        """
+        Get a case and its most recent communications as a ready-to-send JSON document
+        
+        Postgres builds the whole response body (timestamps already in ISO-8601),
+        so no per-row Python conversion or re-serialization is needed.
+        
+        Args:
+            case_id: UUID of the case
+            limit: Maximum number of communications to include
+            
+        Returns:
+            ServiceResult with a single {"payload": <JSON text>} entry, or no data if
+            the case does not exist
+        """
+        try:
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            payload = await db_pool.fetchval("""
+                SELECT json_build_object(
+                    'case_id', c.case_id,
+                    'client_name', c.client_name,
+                    'client_email', c.client_email,
+                    'client_phone', c.client_phone,
+                    'case_status', c.status,
+                    'last_communication_date', cm.last_communication_date,
+                    'communication_summary', json_build_object(
+                        'total_communications', cm.total_communications,
+                        'last_communication_date', cm.last_communication_date
+                    ),
+                    'communications', cm.communications
+                )::text
+                FROM cases c
+                CROSS JOIN LATERAL (
+                    SELECT COALESCE(json_agg(cc ORDER BY cc.created_at DESC), '[]'::json) AS communications,
+                           COUNT(*) AS total_communications,
+                           MAX(cc.created_at) AS last_communication_date
+                    FROM (
+                        SELECT communication_id, channel, direction, status, opened_at,
+                               sender, recipient, subject, message_content,
+                               created_at, sent_at, resend_id
+                        FROM client_communications
+                        WHERE case_id = c.case_id
+                        ORDER BY created_at DESC
+                        LIMIT $2
+                    ) cc
+                ) cm
+                WHERE c.case_id = $1
+            """, case_id, limit)
+            
+            if payload is None:
+                return ServiceResult(success=True, data=[], count=0)
+            
+            return ServiceResult(success=True, data=[{"payload": payload}], count=1)
+            
+        except asyncpg.DataError as e:
+            # Malformed case ID
+            return ServiceResult(
+                success=False,
+                error=f"Invalid value: {e}",
+                error_type="INVALID_QUERY"
+            )
+        except Exception as e:
+            logger.error(f"Failed to get case {case_id} with communications: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="EXECUTION_ERROR"
+            )
+    
+    async def _attach_last_communication_dates(self, cases_data: List[Dict[str, Any]]) -> None:
+        """
+        Set last_communication_date on each case using a single grouped query
+        
+        Args:
+            cases_data: Case dicts to annotate in place
+        """
+        if not cases_data:
+            return
+        
+        from database.connection import get_db_pool
+        db_pool = get_db_pool()
+        
+        rows = await db_pool.fetch("""
+            SELECT case_id, MAX(created_at) AS last_communication_date
+            FROM client_communications
+            WHERE case_id = ANY($1::uuid[])
+            GROUP BY case_id
+        """, [str(case['case_id']) for case in cases_data])
+        
+        last_dates = {
+            str(row['case_id']): row['last_communication_date'].isoformat()
+            for row in rows
+        }
+        for case in cases_data:
+            case['last_communication_date'] = last_dates.get(str(case['case_id']))
+    
+    async def case_exists(self, case_id: str) -> bool:
+        """
+        Check whether a case exists, using a short-lived cache of confirmed IDs
+        
+        Args:
+            case_id: UUID of the case
+            
+        Returns:
+            True if the case exists, False otherwise (including malformed IDs)
+        """
+        case_id = str(case_id)
+        now = time.monotonic()
+        
+        valid_until = self._known_case_ids.get(case_id)
+        if valid_until is not None and valid_until > now:
+            return True
+        
+        try:
+            exists = bool(await self.get_existing_ids([case_id]))
+        except asyncpg.DataError:
+            # Not a valid UUID
+            return False
+        
+        if exists:
+            if len(self._known_case_ids) >= CASE_EXISTS_CACHE_MAX_SIZE:
+                self._known_case_ids.clear()
+            self._known_case_ids[case_id] = now + CASE_EXISTS_CACHE_TTL_SECONDS
+        else:
+            self._known_case_ids.pop(case_id, None)
+        
+        return exists
+    
     async def get_cases_by_client_email(self, client_email: str) -> ServiceResult:
         """
         Get all cases for a specific client email
@@ -254,32 +519,8 @@ class CasesService(BaseService):
             if last_communication_date_filter:
                 logger.warning("Last communication date filtering requires cross-service integration - skipping for now")
             
-            # Add last communication dates to results
-            from services.communications_service import get_communications_service
-            communications_service = get_communications_service()
-            
-            for case in cases_data:
-                case_id = case['case_id']
-                
-                # Get last communication for this case
-                comm_result = await communications_service.read(
-                    filters={"case_id": case_id},
-                    order_by=[{"field": "created_at", "dir": "desc"}],
-                    limit=1
-                )
-                
-                if comm_result.success and comm_result.data:
-                    last_comm = comm_result.data[0]
-                    last_comm_date = last_comm.get('created_at')
-                    if last_comm_date:
-                        if isinstance(last_comm_date, str):
-                            case['last_communication_date'] = last_comm_date
-                        else:
-                            case['last_communication_date'] = last_comm_date.isoformat()
-                    else:
-                        case['last_communication_date'] = None
-                else:
-                    case['last_communication_date'] = None
+            # Add last communication dates to results with one batched query
+            await self._attach_last_communication_dates(cases_data)
             
             return ServiceResult(
                 success=True,
@@ -345,7 +586,10 @@ class CasesService(BaseService):
         
         try:
             # Use the base service delete method
-            return await self.delete(case_id)
+            result = await self.delete(case_id)
+            if result.success:
+                self._known_case_ids.pop(str(case_id), None)
+            return result
         except Exception as e:
             logger.error(f"Delete case failed for {case_id}: {e}")
             return ServiceResult(
@@ -377,93 +621,60 @@ class CasesService(BaseService):
             offset=offset
         )
     
-    async def get_cases_needing_reminders(self, days_since_last_contact: int = 3) -> ServiceResult:
+    async def get_cases_needing_reminders_json(
+        self,
+        days_since_last_contact: int = 3,
+        limit: int = 20,
+        after_case_id: Optional[str] = None
+    ) -> ServiceResult:
         """
-        Get cases that need reminder emails
+        Get a page of cases needing reminders as a finished JSON response body
+        
+        Postgres builds the cases array, the count and the next-page cursor, so the
+        rows never materialize as Python dicts.
         
         Args:
             days_since_last_contact: Days since last communication
+            limit: Maximum number of cases to return
+            after_case_id: Return cases after this one (the previous page's last case)
             
         Returns:
-            ServiceResult with cases needing reminders
+            ServiceResult whose single row holds the JSON text under "payload"
         """
-        from datetime import datetime, timedelta
-        logger.info(f"Getting cases needing reminders (>{days_since_last_contact} days)")
+        logger.debug("Getting cases needing reminders (>%s days)", days_since_last_contact)
         
         try:
-            # Get all open cases first
-            filters = {"status": "OPEN"}
-            order_by = [{"field": "created_at", "dir": "asc"}]
-            
-            cases_result = await self.read(
-                filters=filters,
-                order_by=order_by,
-                limit=100
-            )
-            
-            if not cases_result.success:
-                return cases_result
-            
-            # Import communications service
-            from services.communications_service import get_communications_service
-            communications_service = get_communications_service()
-            
-            cutoff_date = datetime.utcnow() - timedelta(days=days_since_last_contact)
-            cases_needing_reminders = []
-            
-            # For each case, check if it needs a reminder
-            for case in cases_result.data:
-                case_id = case['case_id']
-                
-                # Get last communication for this case
-                comm_result = await communications_service.read(
-                    filters={"case_id": case_id},
-                    order_by=[{"field": "created_at", "dir": "desc"}],
-                    limit=1
-                )
-                
-                needs_reminder = False
-                last_communication_date = None
-                
-                if comm_result.success and comm_result.data:
-                    last_comm = comm_result.data[0]
-                    last_comm_date = last_comm.get('created_at')
-                    
-                    if last_comm_date:
-                        if isinstance(last_comm_date, str):
-                            # Parse ISO string to datetime for comparison
-                            from datetime import datetime
-                            last_comm_dt = datetime.fromisoformat(last_comm_date.replace('Z', '+00:00'))
-                        else:
-                            last_comm_dt = last_comm_date
-                        
-                        last_communication_date = last_comm_dt.isoformat()
-                        
-                        # Check if last communication is older than cutoff
-                        if last_comm_dt < cutoff_date:
-                            needs_reminder = True
-                    else:
-                        needs_reminder = True  # No communication date means no communication
-                else:
-                    needs_reminder = True  # No communications found
-                
-                if needs_reminder:
-                    case_data = {
-                        "case_id": case['case_id'],
-                        "client_email": case['client_email'],
-                        "client_name": case['client_name'],
-                        "client_phone": case.get('client_phone'),
-                        "status": case['status'],
-                        "last_communication_date": last_communication_date
-                    }
-                    cases_needing_reminders.append(case_data)
-            
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            payload = await db_pool.fetchval(f"""
+                WITH page AS ({_PENDING_REMINDER_CASES_SQL})
+                SELECT json_build_object(
+                    'found_cases', COUNT(*),
+                    'cases', COALESCE(json_agg(json_build_object(
+                        'case_id', case_id,
+                        'client_email', client_email,
+                        'client_name', client_name,
+                        'client_phone', client_phone,
+                        'status', status,
+                        'last_communication_date', last_communication_date
+                    ) ORDER BY created_at, case_id), '[]'::json),
+                    'next_cursor', CASE WHEN COUNT(*) = $2 THEN
+                        (array_agg(case_id ORDER BY created_at DESC, case_id DESC))[1]
+                    END
+                )::text
+                FROM page
+            """, days_since_last_contact, limit, after_case_id)
+            
+            return ServiceResult(success=True, data=[{"payload": payload}], count=1)
+            
+        except asyncpg.DataError as e:
+            # Malformed cursor
             return ServiceResult(
-                success=True,
-                data=cases_needing_reminders,
-                count=len(cases_needing_reminders)
+                success=False,
+                error=f"Invalid value: {e}",
+                error_type="INVALID_QUERY"
             )
-            
         except Exception as e:
             logger.error(f"Get cases needing reminders failed: {e}")
             return ServiceResult(
@@ -507,12 +718,14 @@ class CasesService(BaseService):
                 error_type="EXECUTION_ERROR"
             )
     
-    async def get_case_analysis_summary(self, case_id: str) -> ServiceResult:
+    async def get_case_analysis_summary(self, case_id: str, limit: int = 50, offset: int = 0) -> ServiceResult:
         """
         Get analysis summary for all documents in a case
         
         Args:
             case_id: UUID of the case
+            limit: Maximum number of analysis records to include
+            offset: Number of analysis records to skip
             
         Returns:
             ServiceResult with analysis summary data
@@ -520,18 +733,28 @@ class CasesService(BaseService):
         logger.info(f"Getting analysis summary for case {case_id}")
         
         try:
-            # Verify case exists first
-            case_result = await self.get_case_by_id(case_id)
+            from services.documents_service import get_document_analysis_service
+            documents_service = get_document_analysis_service()
+            
+            # The case lookup and the analysis page are independent, so run them
+            # concurrently on separate pooled connections; a missing case just
+            # discards the (cheap) analysis read
+            case_result, analysis_result = await asyncio.gather(
+                self.get_case_by_id(case_id),
+                documents_service.get_aggregated_analysis(case_id, limit=limit, offset=offset)
+            )
+            
             if not case_result.success:
                 return case_result  # Return the same error
+            if not case_result.data:
+                return ServiceResult(
+                    success=False,
+                    error=f"Case {case_id} not found",
+                    error_type="RESOURCE_NOT_FOUND"
+                )
             
             case_data = case_result.data[0]
             
-            # Get aggregated analysis from documents service
-            from services.documents_service import get_document_analysis_service
-            documents_service = get_document_analysis_service()
-            
-            analysis_result = await documents_service.get_aggregated_analysis(case_id)
             if not analysis_result.success:
                 logger.warning(f"Failed to get document analysis for case {case_id}: {analysis_result.error}")
                 # Return case with empty analysis rather than failing completely
@@ -545,13 +768,14 @@ class CasesService(BaseService):
                     }
                 )
             
-            # Format the response to match the route's expected structure
+            # Counts come from the SQL aggregate rather than the Python list length
+            aggregated = analysis_result.data[0]
             return ServiceResult(
                 success=True,
                 data={
                     "case_id": case_id,
                     "client_name": case_data['client_name'],
-                    "total_documents_analyzed": len(analysis_result.data),
+                    "total_documents_analyzed": aggregated['total_documents'],
                     "analysis_results": analysis_result.data
                 }
             )
@@ -621,35 +845,10 @@ class CasesService(BaseService):
             if not cases_result.success:
                 return cases_result
             
-            # Import communications service
-            from services.communications_service import get_communications_service
-            communications_service = get_communications_service()
-            
             cases_data = cases_result.data
             
-            # For each case, get the last communication date
-            for case in cases_data:
-                case_id = case['case_id']
-                
-                # Get last communication for this case
-                comm_result = await communications_service.read(
-                    filters={"case_id": case_id},
-                    order_by=[{"field": "created_at", "dir": "desc"}],
-                    limit=1
-                )
-                
-                if comm_result.success and comm_result.data:
-                    last_comm = comm_result.data[0]
-                    last_comm_date = last_comm.get('created_at')
-                    if last_comm_date:
-                        if isinstance(last_comm_date, str):
-                            case['last_communication_date'] = last_comm_date
-                        else:
-                            case['last_communication_date'] = last_comm_date.isoformat()
-                    else:
-                        case['last_communication_date'] = None
-                else:
-                    case['last_communication_date'] = None
+            # Last communication dates for the whole page in one batched query
+            await self._attach_last_communication_dates(cases_data)
             
             return ServiceResult(
                 success=True,
@@ -3,6 +3,7 @@ Communications service - business logic for client communication management
 """
 
 import logging
+import asyncpg
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from services.base_service import BaseService, ServiceResult
@@ -397,30 +398,46 @@ class CommunicationsService(BaseService):
             ServiceResult with updated communication
         """
         try:
-            # First find the communication by resend_id
-            find_result = await self.read(
-                filters={"resend_id": resend_id},
-                limit=1
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            # Resolve and update in one statement so the webhook holds a single
+            # pooled round-trip instead of a SELECT followed by an UPDATE
+            row = await db_pool.fetchrow(
+                f"""
+                UPDATE client_communications
+                SET status = $2, opened_at = COALESCE($3, opened_at)
+                WHERE communication_id = (
+                    SELECT communication_id FROM client_communications
+                    WHERE resend_id = $1
+                    LIMIT 1
+                )
+                RETURNING {self._returning_columns(self.resource_name)}
+                """,
+                resend_id, status, opened_at
             )
             
-            if not find_result.success or not find_result.data:
+            if not row:
                 return ServiceResult(
                     success=False,
                     error=f"Communication with resend_id {resend_id} not found",
                     error_type="RESOURCE_NOT_FOUND"
                 )
             
-            communication = find_result.data[0]
-            communication_id = communication['communication_id']
-            
-            # Update the communication
-            updates = {"status": status}
-            if opened_at:
-                updates["opened_at"] = opened_at
-            
-            logger.info(f"Updating communication {communication_id} (resend_id: {resend_id}) status to {status}")
-            return await self.update(communication_id, updates)
+            logger.info(f"Updated communication {row['communication_id']} (resend_id: {resend_id}) status to {status}")
+            return ServiceResult(
+                success=True,
+                data=[self._row_to_dict(row, set())],
+                count=1
+            )
             
+        except asyncpg.DataError as e:
+            logger.warning(f"Invalid status update for resend_id {resend_id}: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="INVALID_QUERY"
+            )
         except Exception as e:
             logger.error(f"Failed to update communication status by resend_id {resend_id}: {e}")
             return ServiceResult(
@@ -3,7 +3,8 @@ Documents service - business logic for document and document analysis management
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import asyncpg
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from services.base_service import BaseService, ServiceResult
 
@@ -163,17 +164,104 @@ class DocumentAnalysisService(BaseService):
         logger.info(f"Creating analysis for document {document_id}")
         return await self.create(analysis_data)
     
+    async def store_analysis_result(
+        self,
+        document_id: str,
+        case_id: str,
+        analysis_content: str,
+        model_used: str,
+        tokens_used: Optional[int] = None,
+        analysis_reasoning: Optional[str] = None,
+        analysis_status: str = "COMPLETED"
+    ) -> ServiceResult:
+        """
+        Store an analysis and mark its document COMPLETED in a single statement
+        
+        The document and case foreign keys double as the existence checks, so a
+        missing document or case comes back as NOT_FOUND without extra lookups.
+        
+        Args:
+            document_id: UUID of the analyzed document
+            case_id: UUID of the associated case
+            analysis_content: The analysis content/result
+            model_used: Name of the AI model used for analysis
+            tokens_used: Number of tokens consumed (optional)
+            analysis_reasoning: Reasoning behind the analysis (optional)
+            analysis_status: Status of analysis (default: COMPLETED)
+            
+        Returns:
+            ServiceResult with the stored analysis_id and analyzed_at
+        """
+        logger.info(f"Storing analysis for document {document_id}")
+        
+        try:
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
+            
+            async with db_pool.acquire() as conn:
+                row = await conn.fetchrow("""
+                    WITH ins AS (
+                        INSERT INTO document_analysis (
+                            document_id, case_id, analysis_content, model_used,
+                            analysis_status, tokens_used, analysis_reasoning,
+                            analyzed_at, context_summary_created, created_at
+                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, FALSE, NOW())
+                        RETURNING analysis_id, analyzed_at
+                    ), upd AS (
+                        UPDATE documents SET status = 'COMPLETED' WHERE document_id = $1
+                    )
+                    SELECT analysis_id, analyzed_at FROM ins
+                """, document_id, case_id, analysis_content, model_used,
+                     analysis_status, tokens_used, analysis_reasoning, datetime.utcnow())
+            
+            return ServiceResult(
+                success=True,
+                data=[self._row_to_dict(row, set())],
+                count=1
+            )
+            
+        except asyncpg.ForeignKeyViolationError as e:
+            missing = "Case" if e.constraint_name == "fk_document_analysis_case" else "Document"
+            return ServiceResult(
+                success=False,
+                error=f"{missing} not found",
+                error_type="NOT_FOUND"
+            )
+        except asyncpg.DataError as e:
+            # Malformed document/case ID
+            return ServiceResult(
+                success=False,
+                error=f"Invalid value: {e}",
+                error_type="INVALID_QUERY"
+            )
+        except Exception as e:
+            logger.error(f"Failed to store analysis for document {document_id}: {e}")
+            return ServiceResult(
+                success=False,
+                error=str(e),
+                error_type="EXECUTION_ERROR"
+            )
+    
     async def get_analysis_by_id(self, analysis_id: str) -> ServiceResult:
         """Get an analysis by its ID"""
         return await self.get_by_id(analysis_id)
     
     async def get_analyses_by_document(self, document_id: str) -> ServiceResult:
-        """Get all analyses for a specific document"""
-        return await self.get_by_field("document_id", document_id, 50)
+        """Get the analyses for a specific document, newest first"""
+        return await self.read(
+            filters={"document_id": document_id},
+            order_by=[{"field": "analyzed_at", "dir": "desc"}],
+            limit=50
+        )
     
-    async def get_analyses_by_case(self, case_id: str) -> ServiceResult:
-        """Get all analyses for a specific case"""
-        return await self.get_by_field("case_id", case_id, 50)
+    async def get_analyses_by_case(self, case_id: str, limit: int = 50, offset: int = 0) -> ServiceResult:
+        """Get a page of analyses for a specific case, newest first"""
+        return await self.read(
+            filters={"case_id": case_id},
+            order_by=[{"field": "analyzed_at", "dir": "desc"}],
+            limit=limit,
+            offset=offset
+        )
     
     async def get_analyses_by_status(self, status: str, limit: int = 50) -> ServiceResult:
         """Get analyses by status"""
@@ -234,65 +322,96 @@ class DocumentAnalysisService(BaseService):
                 error_type="EXECUTION_ERROR"
             )
     
+    async def get_existing_document_and_case_ids(
+        self,
+        document_ids: List[Any],
+        case_ids: List[Any]
+    ) -> Tuple[set, set]:
+        """
+        Check which referenced documents and cases exist in a single round trip
+        
+        Args:
+            document_ids: Document IDs referenced by a batch of analyses
+            case_ids: Case IDs referenced by the same batch
+            
+        Returns:
+            (existing document IDs, existing case IDs), both as sets of strings
+        """
+        from database.connection import get_db_pool
+        db_pool = get_db_pool()
+        if not db_pool:
+            raise RuntimeError("Database pool not initialized")
+        
+        rows = await db_pool.fetch("""
+            SELECT 'document' AS kind, document_id AS id FROM documents WHERE document_id = ANY($1::uuid[])
+            UNION ALL
+            SELECT 'case' AS kind, case_id AS id FROM cases WHERE case_id = ANY($2::uuid[])
+        """, [str(document_id) for document_id in document_ids], [str(case_id) for case_id in case_ids])
+        
+        existing_document_ids = {str(row['id']) for row in rows if row['kind'] == 'document'}
+        existing_case_ids = {str(row['id']) for row in rows if row['kind'] == 'case'}
+        return existing_document_ids, existing_case_ids
+    
     async def store_bulk_analysis(self, analyses: List[Dict[str, Any]]) -> ServiceResult:
         """
         Store multiple analysis results in a single atomic transaction
         
+        Rows are pipelined with executemany and the analyzed documents are marked
+        COMPLETED with one UPDATE, instead of a round trip per record.
+        
         Args:
             analyses: List of analysis data dictionaries
             
         Returns:
-            ServiceResult with success/failure details and partial results
+            ServiceResult with the number of stored analyses; on failure the
+            whole batch is rolled back
         """
         logger.info(f"Storing bulk analysis for {len(analyses)} documents")
         
+        if not analyses:
+            return ServiceResult(success=True, data=[], count=0)
+        
+        analyzed_at = datetime.utcnow()
+        records = [
+            (
+                analysis_data['document_id'],
+                analysis_data['case_id'],
+                analysis_data['analysis_content'],
+                analysis_data['model_used'],
+                analysis_data.get('analysis_status', 'COMPLETED'),
+                analysis_data.get('tokens_used'),
+                analysis_data.get('analysis_reasoning'),
+                analyzed_at
+            )
+            for analysis_data in analyses
+        ]
+        document_ids = list({analysis_data['document_id'] for analysis_data in analyses})
+        
         try:
-            # Note: This requires atomic bulk operations with partial failure handling
-            # For MVP, iterate through analyses individually
-            # In production, implement proper bulk SQL operations
-            
-            successful_analyses = []
-            failed_analyses = []
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
             
-            for i, analysis_data in enumerate(analyses):
-                try:
-                    result = await self.create_analysis(
-                        document_id=analysis_data.get('document_id'),
-                        case_id=analysis_data.get('case_id'),
-                        analysis_content=analysis_data.get('analysis_content'),
-                        model_used=analysis_data.get('model_used'),
-                        analysis_status=analysis_data.get('analysis_status', 'COMPLETE'),
-                        tokens_used=analysis_data.get('tokens_used'),
-                        analysis_reasoning=analysis_data.get('analysis_reasoning')
-                    )
+            async with db_pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany("""
+                        INSERT INTO document_analysis (
+                            document_id, case_id, analysis_content, model_used,
+                            analysis_status, tokens_used, analysis_reasoning,
+                            analyzed_at, context_summary_created, created_at
+                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, FALSE, NOW())
+                    """, records)
                     
-                    if result.success:
-                        successful_analyses.extend(result.data)
-                    else:
-                        failed_analyses.append({
-                            "index": i,
-                            "document_id": analysis_data.get('document_id'),
-                            "error": result.error
-                        })
-                        
-                except Exception as e:
-                    failed_analyses.append({
-                        "index": i,
-                        "document_id": analysis_data.get('document_id'),
-                        "error": str(e)
-                    })
-            
-            success_count = len(successful_analyses)
-            failure_count = len(failed_analyses)
+                    await conn.execute(
+                        "UPDATE documents SET status = 'COMPLETED' WHERE document_id = ANY($1::uuid[])",
+                        document_ids
+                    )
             
-            logger.info(f"Bulk analysis complete: {success_count} successful, {failure_count} failed")
+            logger.info(f"Bulk analysis stored: {len(records)} analyses, {len(document_ids)} documents completed")
             
             return ServiceResult(
-                success=failure_count == 0,  # Only success if all succeeded
-                data=successful_analyses,
-                count=success_count,
-                error=f"Partial success: {failure_count} failures" if failure_count > 0 else None,
-                error_type="PARTIAL_FAILURE" if failure_count > 0 else None
+                success=True,
+                data=[],
+                count=len(records)
             )
             
         except Exception as e:
@@ -321,9 +440,9 @@ class DocumentAnalysisService(BaseService):
             
             async with db_pool.acquire() as conn:
                 async with conn.transaction():
-                    # Get document_id before deletion for status update
+                    # Delete the analysis; RETURNING doubles as the not-found check
                     doc_id = await conn.fetchval(
-                        "SELECT document_id FROM document_analysis WHERE analysis_id = $1",
+                        "DELETE FROM document_analysis WHERE analysis_id = $1 RETURNING document_id",
                         analysis_id
                     )
                     
@@ -334,33 +453,14 @@ class DocumentAnalysisService(BaseService):
                             error_type="NOT_FOUND"
                         )
                     
-                    # Delete the analysis
-                    result = await conn.execute(
-                        "DELETE FROM document_analysis WHERE analysis_id = $1",
-                        analysis_id
-                    )
-                    
-                    if result == "DELETE 0":
-                        return ServiceResult(
-                            success=False,
-                            error="Analysis not found",
-                            error_type="NOT_FOUND"
-                        )
-                    
-                    # Check if document has any other analyses
-                    other_analyses = await conn.fetchval(
-                        "SELECT COUNT(*) FROM document_analysis WHERE document_id = $1",
-                        doc_id
-                    )
-                    
                     # If no other analyses exist, update document status back to processing
-                    document_status_updated = False
-                    if other_analyses == 0:
-                        await conn.execute(
-                            "UPDATE documents SET status = 'PROCESSING' WHERE document_id = $1",
-                            doc_id
-                        )
-                        document_status_updated = True
+                    updated_doc_id = await conn.fetchval("""
+                        UPDATE documents SET status = 'PROCESSING'
+                        WHERE document_id = $1
+                          AND NOT EXISTS (SELECT 1 FROM document_analysis WHERE document_id = $1)
+                        RETURNING document_id
+                    """, doc_id)
+                    document_status_updated = updated_doc_id is not None
                     
                     logger.info(f"Analysis {analysis_id} deleted successfully")
                     
@@ -383,12 +483,24 @@ class DocumentAnalysisService(BaseService):
                 error_type="EXECUTION_ERROR"
             )
     
-    async def get_aggregated_analysis(self, case_id: str) -> ServiceResult:
+    async def get_aggregated_analysis(
+        self,
+        case_id: str,
+        include_analyses: bool = True,
+        limit: int = 50,
+        offset: int = 0
+    ) -> ServiceResult:
         """
         Get aggregated analysis data for all documents in a case
         
+        Counts, token totals, models and the analysis time range are computed
+        by Postgres in a single query rather than by looping over rows in Python.
+        
         Args:
             case_id: UUID of the case
+            include_analyses: Also return the individual analysis records
+            limit: Maximum number of analysis records to include
+            offset: Number of analysis records to skip
             
         Returns:
             ServiceResult with aggregated analysis data
@@ -396,39 +508,53 @@ class DocumentAnalysisService(BaseService):
         logger.info(f"Getting aggregated analysis for case {case_id}")
         
         try:
-            # Get all analyses for the case
-            analyses_result = await self.get_analyses_by_case(case_id)
-            if not analyses_result.success:
-                return analyses_result
+            from database.connection import get_db_pool
+            db_pool = get_db_pool()
             
-            analyses = analyses_result.data
+            # The case's rows are read once into a materialized CTE and both the
+            # totals and the per-status counts aggregate over it
+            row = await db_pool.fetchrow("""
+                WITH da AS MATERIALIZED (
+                    SELECT analysis_status, tokens_used, model_used, analyzed_at
+                    FROM document_analysis
+                    WHERE case_id = $1
+                )
+                SELECT
+                    COUNT(*) AS total_documents,
+                    COALESCE(SUM(tokens_used), 0) AS total_tokens_used,
+                    COALESCE(
+                        array_agg(DISTINCT model_used) FILTER (WHERE model_used IS NOT NULL),
+                        ARRAY[]::varchar[]
+                    ) AS models_used,
+                    MIN(analyzed_at) AS earliest_analysis,
+                    MAX(analyzed_at) AS latest_analysis,
+                    (
+                        SELECT COALESCE(jsonb_object_agg(s.analysis_status, s.n), '{}'::jsonb)
+                        FROM (
+                            SELECT COALESCE(analysis_status, 'UNKNOWN') AS analysis_status, COUNT(*) AS n
+                            FROM da
+                            GROUP BY 1
+                        ) s
+                    ) AS analysis_status_counts
+                FROM da
+            """, case_id)
             
-            # Aggregate the data
             aggregated_data = {
                 "case_id": case_id,
-                "total_documents": len(analyses),
-                "analysis_status_counts": {},
-                "total_tokens_used": 0,
-                "models_used": set(),
-                "analyses": analyses
+                "total_documents": row['total_documents'],
+                "analysis_status_counts": row['analysis_status_counts'],
+                "total_tokens_used": row['total_tokens_used'],
+                "models_used": list(row['models_used']),
+                "earliest_analysis": row['earliest_analysis'].isoformat() if row['earliest_analysis'] else None,
+                "latest_analysis": row['latest_analysis'].isoformat() if row['latest_analysis'] else None
             }
             
-            for analysis in analyses:
-                # Count by status
-                status = analysis.get('analysis_status', 'UNKNOWN')
-                aggregated_data["analysis_status_counts"][status] = aggregated_data["analysis_status_counts"].get(status, 0) + 1
-                
-                # Sum tokens
-                tokens = analysis.get('tokens_used', 0) or 0
-                aggregated_data["total_tokens_used"] += tokens
-                
-                # Collect models
-                model = analysis.get('model_used')
-                if model:
-                    aggregated_data["models_used"].add(model)
-            
-            # Convert set to list for JSON serialization
-            aggregated_data["models_used"] = list(aggregated_data["models_used"])
+            if include_analyses:
+                # Only a bounded page of records is materialized, however large the case
+                analyses_result = await self.get_analyses_by_case(case_id, limit, offset)
+                if not analyses_result.success:
+                    return analyses_result
+                aggregated_data["analyses"] = analyses_result.data
             
             return ServiceResult(
                 success=True,
@@ -3,88 +3,143 @@ Email service using Resend API
 """
 
 import logging
+import uuid
 from datetime import datetime
-import resend
-from fastapi import HTTPException
+from html import escape
+from typing import List, Optional
+import httpx
+import orjson
+from fastapi import BackgroundTasks, HTTPException
 
-from config.settings import FROM_EMAIL, ALERT_FROM_EMAIL
+from config.settings import FROM_EMAIL, ALERT_FROM_EMAIL, RESEND_API_KEY
 from models.email import EmailRequest, EmailResponse
 from database.connection import get_db_pool
 
 logger = logging.getLogger(__name__)
 
-async def send_email_via_resend(request: EmailRequest) -> EmailResponse:
-    """Send email via Resend API"""
-    db_pool = get_db_pool()
-    
+# Shared keep-alive client for the Resend REST API; closed in the app lifespan
+resend_client = httpx.AsyncClient(
+    base_url="https://api.resend.com",
+    headers={
+        "Authorization": f"Bearer {RESEND_API_KEY}",
+        "Content-Type": "application/json"
+    },
+    timeout=30.0
+)
+
+def _text_to_html(text: str) -> str:
+    """Render a plain-text body as escaped HTML with line breaks preserved"""
+    return "<p>" + escape(text).replace("\n", "<br>") + "</p>"
+
+async def _send_via_resend(email_data: dict) -> dict:
+    """POST an email to Resend and return the parsed response body"""
+    response = await resend_client.post("/emails", content=orjson.dumps(email_data))
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+_INSERT_OUTGOING_EMAIL_SQL = """
+    INSERT INTO client_communications 
+    (communication_id, case_id, channel, direction, status, sender, recipient, subject, message_content, sent_at, resend_id)
+    VALUES ($1, $2, 'email', 'outgoing', $3, $4, $5, $6, $7, $8, $9)
+"""
+
+async def _log_outgoing_email(
+    communication_id: uuid.UUID,
+    request: EmailRequest,
+    status: str,
+    sender: str,
+    sent_at: datetime,
+    resend_id: Optional[str]
+) -> None:
+    """Record an outgoing email in client_communications with a single INSERT"""
+    await get_db_pool().execute(
+        _INSERT_OUTGOING_EMAIL_SQL,
+        communication_id, request.case_id, status, sender,
+        request.recipient_email, request.subject, request.body, sent_at, resend_id
+    )
+
+async def _log_sent_email_in_background(
+    communication_id: uuid.UUID,
+    request: EmailRequest,
+    sender: str,
+    sent_at: datetime,
+    resend_id: Optional[str]
+) -> None:
+    """Background task: log a successfully sent email after the response has gone out"""
     try:
-        # Send email via Resend
-        email_data = {
-            "from": FROM_EMAIL or "noreply@test.example.com",
-            "to": [request.recipient_email],
-            "subject": request.subject,
-            "html": request.html_body or f"<p>{request.body.replace(chr(10), '<br>')}</p>",
-            "text": request.body
-        }
-        
-        result = resend.Emails.send(email_data)
-        # Extract just the ID string from the Resend response
-        if hasattr(result, 'id'):
-            resend_id = result.id
-        elif isinstance(result, dict) and 'id' in result:
-            resend_id = result['id']
-        else:
-            resend_id = None
-        
-        # Log to database and get the generated UUID
-        async with db_pool.acquire() as conn:
-            # Insert into client_communications table and get the generated id
-            comm_id = await conn.fetchval("""
-                INSERT INTO client_communications 
-                (case_id, channel, direction, status, sender, recipient, subject, message_content, sent_at, resend_id)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                RETURNING communication_id
-            """,
-            request.case_id, "email", "outgoing", "sent", FROM_EMAIL or "noreply@test.example.com", 
-            request.recipient_email, request.subject, request.body, datetime.utcnow(), resend_id)
-        
-        logger.info(f"Email sent via Resend - ID: {resend_id}, To: {request.recipient_email}")
-        
-        return EmailResponse(
-            message_id=str(comm_id),
-            status="sent",
-            recipient=request.recipient_email,
-            case_id=request.case_id,
-            sent_via="resend"
-        )
-        
+        await _log_outgoing_email(communication_id, request, "sent", sender, sent_at, resend_id)
     except Exception as e:
-        # Log failure
-        async with db_pool.acquire() as conn:
-            # Insert into client_communications table and get the generated id
-            await conn.fetchval("""
-                INSERT INTO client_communications 
-                (case_id, channel, direction, status, sender, recipient, subject, message_content, sent_at, resend_id)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                RETURNING communication_id
-            """,
-            request.case_id, "email", "outgoing", "failed", FROM_EMAIL or "noreply@test.example.com", 
-            request.recipient_email, request.subject, request.body, datetime.utcnow(), None)
-        
-        logger.error(f"Email sending failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Email sending failed: {str(e)}")
+        logger.error(f"Failed to log email to {request.recipient_email} (Resend ID: {resend_id}): {e}")
 
-async def send_direct_alert(recipient: str, subject: str, html_body: str):
-    """Send alert email directly - bypasses database logging"""
+async def send_email_via_resend(request: EmailRequest, background_tasks: BackgroundTasks) -> EmailResponse:
+    """
+    Send email via Resend API
+    
+    The communication ID is allocated up front so a successful send can be answered
+    immediately while its client_communications row is written by a background task;
+    failed sends are still logged before the error is raised.
+    """
+    sender = FROM_EMAIL or "noreply@test.example.com"
+    communication_id = uuid.uuid4()
+    
+    # Send email via Resend
+    email_data = {
+        "from": sender,
+        "to": [request.recipient_email],
+        "subject": request.subject,
+        "html": request.html_body or _text_to_html(request.body),
+        "text": request.body
+    }
+    
     try:
-        email_data = {
+        result = await _send_via_resend(email_data)
+    except Exception as send_error:
+        try:
+            await _log_outgoing_email(communication_id, request, "failed", sender, datetime.utcnow(), None)
+        except Exception as e:
+            logger.error(f"Failed to log failed email to {request.recipient_email}: {e}")
+        logger.error(f"Email sending failed: {send_error}")
+        raise HTTPException(status_code=500, detail=f"Email sending failed: {str(send_error)}")
+    
+    # Extract just the ID string from the Resend response
+    resend_id = result.get('id')
+    background_tasks.add_task(
+        _log_sent_email_in_background, communication_id, request, sender, datetime.utcnow(), resend_id
+    )
+    
+    logger.info(f"Email sent via Resend - ID: {resend_id}, To: {request.recipient_email}")
+    
+    return EmailResponse(
+        message_id=str(communication_id),
+        status="sent",
+        recipient=request.recipient_email,
+        case_id=request.case_id,
+        sent_via="resend"
+    )
+
+async def send_direct_alerts(recipients: List[str], subject: str, html_body: str) -> int:
+    """
+    Send the same alert to several recipients with one Resend batch call - bypasses database logging
+    
+    Resend validates the batch as a whole, so either every email is accepted or the call
+    raises; failures are left to the caller to log and count.
+    
+    Returns:
+        Number of emails accepted by Resend
+    """
+    if not recipients:
+        return 0
+    
+    batch = [
+        {
             "from": ALERT_FROM_EMAIL,
             "to": [recipient],
             "subject": subject,
             "html": html_body
         }
-        result = resend.Emails.send(email_data)
-        logger.info(f"Alert sent to {recipient}")
-    except Exception as e:
-        logger.error(f"Failed to send alert to {recipient}: {e}")
-        raise
\ No newline at end of file
+        for recipient in recipients
+    ]
+    response = await resend_client.post("/emails/batch", content=orjson.dumps(batch))
+    response.raise_for_status()
+    logger.info(f"Alert sent to {len(recipients)} recipients")
+    return len(recipients)
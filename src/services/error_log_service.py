@@ -3,8 +3,7 @@ Error logging service with email deduplication functionality
 """
 
 import logging
-import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 from uuid import UUID
 import asyncpg
@@ -36,26 +35,24 @@ class ErrorLogService:
             Tuple of (error_id, should_send_email)
         """
         db_pool = get_db_pool()
+        now = datetime.now(timezone.utc)
         
         async with db_pool.acquire() as conn:
             async with conn.transaction():
                 # Check if email was sent for this component in the last 15 minutes
                 should_send_email = await ErrorLogService._should_send_email(
-                    conn, component
+                    conn, component, now
                 )
                 
-                # Insert the error log
-                # Serialize context to JSON if it's a dictionary
-                context_json = json.dumps(context) if context is not None else None
-                
+                # Insert the error log (context is encoded by the pool's JSONB codec)
                 error_id = await conn.fetchval("""
                     INSERT INTO error_logs (
                         component, error_message, severity, context, email_sent, created_at, updated_at
                     ) VALUES ($1, $2, $3, $4, $5, $6, $7)
                     RETURNING error_id
                 """, 
-                component, error_message, severity, context_json, 
-                should_send_email, datetime.utcnow(), datetime.utcnow())
+                component, error_message, severity, context, 
+                should_send_email, now, now)
                 
                 logger.info(
                     f"Error logged: {component} - {severity} - Email: {should_send_email}"
@@ -64,19 +61,20 @@ class ErrorLogService:
                 return error_id, should_send_email
 
     @staticmethod
-    async def _should_send_email(conn: asyncpg.Connection, component: str) -> bool:
+    async def _should_send_email(conn: asyncpg.Connection, component: str, now: datetime) -> bool:
         """
         Check if an email should be sent for this component based on 15-minute rule
         
         Args:
             conn: Database connection
             component: The component to check
+            now: The caller's timestamp for this error, reused for the window cutoff
             
         Returns:
             True if email should be sent, False if within 15-minute window
         """
         # Calculate the cutoff time (15 minutes ago)
-        cutoff_time = datetime.utcnow() - timedelta(minutes=15)
+        cutoff_time = now - timedelta(minutes=15)
         
         # Check if any email was sent for this component in the last 15 minutes
         recent_email_count = await conn.fetchval("""
@@ -136,18 +134,7 @@ class ErrorLogService:
         async with db_pool.acquire() as conn:
             rows = await conn.fetch(query, *params)
             
-            # Deserialize context JSON back to dictionaries
-            result = []
-            for row in rows:
-                row_dict = dict(row)
-                if row_dict['context']:
-                    try:
-                        row_dict['context'] = json.loads(row_dict['context'])
-                    except (json.JSONDecodeError, TypeError):
-                        row_dict['context'] = None
-                result.append(row_dict)
-            
-            return result
+            return [dict(row) for row in rows]
 
     @staticmethod
     async def get_error_by_id(error_id: UUID) -> Optional[Dict[str, Any]]:
@@ -170,16 +157,7 @@ class ErrorLogService:
                 WHERE error_id = $1
             """, error_id)
             
-            if row:
-                row_dict = dict(row)
-                if row_dict['context']:
-                    try:
-                        row_dict['context'] = json.loads(row_dict['context'])
-                    except (json.JSONDecodeError, TypeError):
-                        row_dict['context'] = None
-                return row_dict
-            
-            return None
+            return dict(row) if row else None
 
     @staticmethod
     async def get_component_stats(component: str, hours: int = 24) -> Dict[str, Any]:
@@ -194,7 +172,7 @@ class ErrorLogService:
             Statistics dictionary
         """
         db_pool = get_db_pool()
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         
         async with db_pool.acquire() as conn:
             stats = await conn.fetchrow("""
@@ -3,7 +3,6 @@ Summary generation service using OpenAI API
 """
 
 import asyncio
-import json
 import logging
 import os
 from typing import List, Dict, Any, Optional
@@ -13,9 +12,13 @@ import openai
 from openai import AsyncOpenAI
 
 from database.connection import get_db_pool
+from utils.helpers import json_dumps_indented
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on messages fed into a single summary generation
+SUMMARY_MAX_MESSAGES = 200
+
 class SummaryService:
     def __init__(self):
         self.client = AsyncOpenAI(
@@ -45,37 +48,39 @@ class SummaryService:
             db_pool = get_db_pool()
             
             async with db_pool.acquire() as conn:
-                # Get all messages for the conversation
+                # Get the most recent messages for the conversation, bounded so
+                # long-lived conversations don't grow the prompt without limit
                 messages = await conn.fetch("""
                     SELECT message_id, role, content, function_name, function_arguments, 
                            function_response, sequence_number, created_at
                     FROM agent_messages 
                     WHERE conversation_id = $1
-                    ORDER BY sequence_number ASC
-                """, conversation_id)
-                
-                if not messages:
-                    logger.warning(f"No messages found for conversation {conversation_id}")
-                    return None
-                
-                # Format messages for OpenAI
-                formatted_messages = self._format_messages_for_prompt(messages)
-                
-                # Call OpenAI API
-                response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": f"Please summarize the following conversation:\n\n{formatted_messages}"}
-                    ],
-                    temperature=0.3,
-                    max_tokens=1000
-                )
-                
-                summary_content = response.choices[0].message.content.strip()
-                logger.info(f"Generated summary for conversation {conversation_id}")
-                
-                return summary_content
+                    ORDER BY sequence_number DESC
+                    LIMIT $2
+                """, conversation_id, SUMMARY_MAX_MESSAGES)
+            
+            if not messages:
+                logger.warning(f"No messages found for conversation {conversation_id}")
+                return None
+            
+            # Format messages for OpenAI, oldest first
+            formatted_messages = self._format_messages_for_prompt(messages[::-1])
+            
+            # Call OpenAI API (connection is already released back to the pool)
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": f"Please summarize the following conversation:\n\n{formatted_messages}"}
+                ],
+                temperature=0.3,
+                max_tokens=1000
+            )
+            
+            summary_content = response.choices[0].message.content.strip()
+            logger.info(f"Generated summary for conversation {conversation_id}")
+            
+            return summary_content
                 
         except Exception as e:
             logger.error(f"Failed to generate summary for conversation {conversation_id}: {e}")
@@ -94,7 +99,7 @@ class SummaryService:
             
             # Handle JSON content
             if isinstance(content, (dict, list)):
-                content_str = json.dumps(content, indent=2)
+                content_str = json_dumps_indented(content)
             else:
                 content_str = str(content)
             
@@ -105,10 +110,10 @@ class SummaryService:
             if msg['function_name']:
                 message_parts.append(f"Function: {msg['function_name']}")
                 if msg['function_arguments']:
-                    args_str = json.dumps(msg['function_arguments'], indent=2) if isinstance(msg['function_arguments'], (dict, list)) else str(msg['function_arguments'])
+                    args_str = json_dumps_indented(msg['function_arguments']) if isinstance(msg['function_arguments'], (dict, list)) else str(msg['function_arguments'])
                     message_parts.append(f"Arguments: {args_str}")
                 if msg['function_response']:
-                    resp_str = json.dumps(msg['function_response'], indent=2) if isinstance(msg['function_response'], (dict, list)) else str(msg['function_response'])
+                    resp_str = json_dumps_indented(msg['function_response']) if isinstance(msg['function_response'], (dict, list)) else str(msg['function_response'])
                     message_parts.append(f"Response: {resp_str}")
             
             formatted.append("\n".join(message_parts))
@@ -128,50 +133,60 @@ class SummaryService:
             db_pool = get_db_pool()
             
             async with db_pool.acquire() as conn:
-                # Get message count and latest message
-                message_info = await conn.fetchrow("""
-                    SELECT COUNT(*) as total_messages, MAX(message_id) as last_message_id
-                    FROM agent_messages 
-                    WHERE conversation_id = $1
-                """, conversation_id)
+                # Serialize the check-then-write per conversation across workers so
+                # concurrent generations cannot insert duplicate summary rows
+                async with conn.transaction():
+                    await conn.execute(
+                        "SELECT pg_advisory_xact_lock(hashtext($1::text))",
+                        conversation_id
+                    )
+                    # Get message count and latest message
+                    message_info = await conn.fetchrow("""
+                        SELECT COUNT(*) as total_messages, MAX(message_id) as last_message_id
+                        FROM agent_messages 
+                        WHERE conversation_id = $1
+                    """, conversation_id)
                 
-                if not message_info or message_info['total_messages'] == 0:
-                    logger.warning(f"No messages found for conversation {conversation_id}")
-                    return False
+                    if not message_info or message_info['total_messages'] == 0:
+                        logger.warning(f"No messages found for conversation {conversation_id}")
+                        return False
                 
-                # Check if summary already exists
-                existing_summary = await conn.fetchrow("""
-                    SELECT summary_id FROM agent_summaries 
-                    WHERE conversation_id = $1
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """, conversation_id)
+                    # generate_summary only reads the newest SUMMARY_MAX_MESSAGES messages
+                    messages_summarized = min(message_info['total_messages'], SUMMARY_MAX_MESSAGES)
                 
-                if existing_summary:
-                    # Update existing summary
-                    await conn.execute("""
-                        UPDATE agent_summaries 
-                        SET summary_content = $1, 
-                            messages_summarized = $2,
-                            last_message_id = $3,
-                            updated_at = NOW()
-                        WHERE summary_id = $4
-                    """, summary_content, message_info['total_messages'], 
-                         message_info['last_message_id'], existing_summary['summary_id'])
+                    # Update the latest summary in place, or insert one if none exists,
+                    # in a single statement
+                    updated = await conn.fetchval("""
+                        WITH upd AS (
+                            UPDATE agent_summaries 
+                            SET summary_content = $2, 
+                                messages_summarized = $3,
+                                last_message_id = $4,
+                                updated_at = NOW()
+                            WHERE summary_id = (
+                                SELECT summary_id FROM agent_summaries 
+                                WHERE conversation_id = $1
+                                ORDER BY created_at DESC
+                                LIMIT 1
+                            )
+                            RETURNING summary_id
+                        ), ins AS (
+                            INSERT INTO agent_summaries 
+                            (conversation_id, last_message_id, summary_content, messages_summarized)
+                            SELECT $1, $4, $2, $3
+                            WHERE NOT EXISTS (SELECT 1 FROM upd)
+                            RETURNING summary_id
+                        )
+                        SELECT EXISTS (SELECT 1 FROM upd)
+                    """, conversation_id, summary_content, messages_summarized,
+                         message_info['last_message_id'])
                     
-                    logger.info(f"Updated summary for conversation {conversation_id}")
-                else:
-                    # Create new summary
-                    await conn.execute("""
-                        INSERT INTO agent_summaries 
-                        (conversation_id, last_message_id, summary_content, messages_summarized)
-                        VALUES ($1, $2, $3, $4)
-                    """, conversation_id, message_info['last_message_id'], 
-                         summary_content, message_info['total_messages'])
-                    
-                    logger.info(f"Created new summary for conversation {conversation_id}")
+                    if updated:
+                        logger.info(f"Updated summary for conversation {conversation_id}")
+                    else:
+                        logger.info(f"Created new summary for conversation {conversation_id}")
                 
-                return True
+                    return True
                 
         except Exception as e:
             logger.error(f"Failed to create/update summary for conversation {conversation_id}: {e}")
@@ -180,12 +195,31 @@ class SummaryService:
 # Global instance
 summary_service = SummaryService()
 
+# Conversations with a summary generation in flight in this worker, mapped to
+# whether more messages arrived meanwhile and another pass is needed
+_in_flight_summaries: Dict[str, bool] = {}
+
 async def trigger_summary_generation(conversation_id: str) -> None:
     """
     Async function to trigger summary generation in background
     This will be called from message create/update endpoints
+    
+    Bursts of messages for the same conversation are coalesced: while a
+    generation is running, further triggers only request one follow-up pass
+    instead of starting parallel OpenAI calls.
     """
+    if conversation_id in _in_flight_summaries:
+        _in_flight_summaries[conversation_id] = True
+        return
+    
+    _in_flight_summaries[conversation_id] = False
     try:
-        await summary_service.create_or_update_summary(conversation_id)
+        while True:
+            await summary_service.create_or_update_summary(conversation_id)
+            if not _in_flight_summaries[conversation_id]:
+                break
+            _in_flight_summaries[conversation_id] = False
     except Exception as e:
-        logger.error(f"Background summary generation failed for conversation {conversation_id}: {e}")
\ No newline at end of file
+        logger.error(f"Background summary generation failed for conversation {conversation_id}: {e}")
+    finally:
+        _in_flight_summaries.pop(conversation_id, None)
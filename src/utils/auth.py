@@ -46,7 +46,7 @@ async def authenticate_api(authorization: Optional[str] = Header(None)) -> AuthC
     Raises:
         HTTPException: 401 if authentication fails
     """
-    logger.info(f"AUTH: Starting JWT authentication check")
+    logger.debug("AUTH: Starting JWT authentication check")
     
     if not authorization:
         logger.error("AUTH: API request missing Authorization header - returning 401")
@@ -63,7 +63,7 @@ async def authenticate_api(authorization: Optional[str] = Header(None)) -> AuthC
         )
     
     token = authorization[7:]  # Remove "Bearer " prefix
-    logger.info(f"AUTH: Extracted JWT token: '{token[:8]}...' (first 8 chars)")
+    logger.debug("AUTH: Extracted JWT token: '%s...' (first 8 chars)", token[:8])
     
     try:
         # Validate JWT token and extract claims
@@ -103,7 +103,7 @@ async def authenticate_agent_jwt(
     Raises:
         HTTPException: 401 if authentication fails, 403 if agent role invalid
     """
-    logger.info("AGENT_AUTH: Starting OAuth2 access token authentication")
+    logger.debug("AGENT_AUTH: Starting OAuth2 access token authentication")
     
     # Validate Authorization header
     if not authorization:
@@ -3,18 +3,18 @@ Centralized Error Handling and Logging System
 Provides enterprise-grade error handling with structured logging, security, and observability.
 """
 
-import json
 import logging
 import traceback
-import uuid
+import secrets
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
 from contextvars import ContextVar
 
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
-from starlette.middleware.base import BaseHTTPMiddleware
+
+from utils.helpers import json_dumps_indented
 
 # Context variables for request tracing
 request_id_var: ContextVar[str] = ContextVar('request_id', default='')
@@ -82,7 +82,7 @@ class StructuredLogger:
         """Log structured error with full context"""
         
         # Generate trace ID for this error
-        trace_id = str(uuid.uuid4())[:8]
+        trace_id = secrets.token_hex(4)
         request_id_var.set(trace_id)
         
         # Build structured log entry
@@ -138,57 +138,93 @@ class StructuredLogger:
             log_entry["endpoint_context"] = endpoint_context
         
         # Log the structured entry
-        logger.error(json.dumps(log_entry, indent=2))
+        logger.error(json_dumps_indented(log_entry))
         
         return trace_id
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    """Middleware to capture request context and add request IDs"""
+class RequestContextMiddleware:
+    """
+    Middleware to capture request context and add request IDs
+    
+    Pure ASGI rather than BaseHTTPMiddleware, so requests are not re-wrapped and
+    responses are not proxied through an extra task and memory stream.
+    """
     
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Generate unique request ID
-        trace_id = str(uuid.uuid4())[:8]
+        trace_id = secrets.token_hex(4)
         request_id_var.set(trace_id)
+        trace_header = (b"x-trace-id", trace_id.encode("latin-1"))
         
         # Store request body for potential error logging
         body = None
         if ErrorHandlingConfig.LOG_REQUEST_BODIES:
             try:
-                body = await request.body()
-                # Re-create request with body for downstream processing
-                request._body = body
+                chunks = []
+                more_body = True
+                while more_body:
+                    message = await receive()
+                    if message["type"] != "http.request":
+                        break
+                    chunks.append(message.get("body", b""))
+                    more_body = message.get("more_body", False)
+                body = b"".join(chunks)
             except Exception as e:
                 StructuredLogger.log_error(
                     "middleware_error",
                     "Failed to capture request body",
-                    request=request,
+                    request=Request(scope),
                     exception=e,
                     include_traceback=False
                 )
         
-        # Add request body to state for error handlers
-        request.state.captured_body = body
-        request.state.trace_id = trace_id
+        if body is not None:
+            # Replay the captured body to downstream handlers, then defer to the server
+            body_sent = False
+            
+            async def replay_receive():
+                nonlocal body_sent
+                if not body_sent:
+                    body_sent = True
+                    return {"type": "http.request", "body": body, "more_body": False}
+                return await receive()
+        else:
+            replay_receive = receive
+        
+        # Add request body to state for error handlers (Request.state is backed by scope["state"])
+        state = scope.setdefault("state", {})
+        state["captured_body"] = body
+        state["trace_id"] = trace_id
+        
+        async def send_with_trace_id(message):
+            if message["type"] == "http.response.start":
+                # Add trace ID to response headers for client-side debugging
+                message["headers"] = [*message.get("headers", ()), trace_header]
+            await send(message)
         
         # Process request
         try:
-            response = await call_next(request)
-            # Add trace ID to response headers for client-side debugging
-            response.headers["X-Trace-ID"] = trace_id
-            return response
+            await self.app(scope, replay_receive, send_with_trace_id)
         except Exception as e:
             # Log unexpected exceptions
             StructuredLogger.log_error(
                 "unhandled_exception",
                 f"Unhandled exception in request processing: {str(e)}",
-                request=request,
+                request=Request(scope),
                 exception=e,
                 extra_context={"body": ErrorHandlingConfig.sanitize_data(body.decode('utf-8')) if body else None}
             )
             raise
 
 # Global Exception Handlers
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions with logging"""
     
     # Log HTTP exceptions (but not 4xx client errors unless configured)
@@ -225,14 +261,14 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         response_content["trace_id"] = trace_id
     
     if ErrorHandlingConfig.INCLUDE_TIMESTAMP:
-        response_content["timestamp"] = datetime.utcnow().isoformat()
+        response_content["timestamp"] = datetime.utcnow()  # orjson emits ISO-8601
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=response_content
     )
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle FastAPI validation errors (HTTP 422)"""
     
     body_str = None
@@ -278,14 +314,14 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         response_content["trace_id"] = trace_id
     
     if ErrorHandlingConfig.INCLUDE_TIMESTAMP:
-        response_content["timestamp"] = datetime.utcnow().isoformat()
+        response_content["timestamp"] = datetime.utcnow()  # orjson emits ISO-8601
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content=response_content
     )
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle all other exceptions"""
     
     body_str = None
@@ -316,9 +352,9 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         response_content["trace_id"] = trace_id
     
     if ErrorHandlingConfig.INCLUDE_TIMESTAMP:
-        response_content["timestamp"] = datetime.utcnow().isoformat()
+        response_content["timestamp"] = datetime.utcnow()  # orjson emits ISO-8601
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=response_content
     )
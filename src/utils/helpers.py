@@ -3,12 +3,43 @@ Utility functions and helpers
 """
 
 import logging
+import re
 from datetime import datetime, timezone
+from typing import Any
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Common webhook timestamp shape: YYYY-MM-DDTHH:MM:SS[.ffffff]Z (already UTC)
+_ISO_UTC_Z_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z$")
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string using orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def json_dumps_indented(value: Any) -> str:
+    """Serialize a value to a 2-space indented JSON string using orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode()
+
+def json_loads(value: Any) -> Any:
+    """Deserialize JSON (str or bytes) using orjson"""
+    return orjson.loads(value)
+
 def parse_uploaded_timestamp(timestamp_str: str) -> datetime:
     """Parse uploaded timestamp handling timezone properly"""
+    # Fast path: UTC 'Z' timestamps map straight to a naive UTC datetime
+    match = _ISO_UTC_Z_RE.match(timestamp_str)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second),
+                int(fraction.ljust(6, '0')) if fraction else 0
+            )
+        except ValueError:
+            pass  # Out-of-range components; let the general path log and fall back
+    
     try:
         # Handle ISO format with 'Z' (UTC)
         if timestamp_str.endswith('Z'):
@@ -60,6 +60,8 @@ async def verify_resend_webhook(request: Request) -> Dict[str, Any]:
         logger.debug("Webhook signature verification successful")
         return verified_payload
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Webhook verification failed: {str(e)}")
         raise HTTPException(